@@ -32,34 +32,50 @@ from kiali_qe.entities.workload import (
 from kiali_qe.entities.applications import Application, ApplicationDetails, AppWorkload
 from kiali_qe.entities.overview import Overview
 from kiali_qe.utils.date import parse_from_ui
-from time import sleep
+from time import sleep, time
 from wait_for import wait_for
 from kiali_qe.utils import (
     get_validation,
     to_linear_string,
     get_texts_of_elements
 )
+from kiali_qe.utils.wait import wait, wait_in_browser
+
+
+SPINNER = '//*[contains(@class, " spinner ")]'
+SPINNER_PARENT = '//*[contains(@class, "navbar")]'
 
 
 def wait_displayed(obj, timeout='10s'):
-    wait_for(
-        lambda: obj.is_displayed, timeout=timeout,
-        delay=0.2, very_quiet=True, silent_failure=True)
+    wait(lambda: obj.is_displayed, timeout=timeout, name='displayed')
 
 
 def wait_not_displayed(obj, timeout='10s'):
-    wait_for(
-        lambda: not obj.is_displayed, timeout=timeout,
-        delay=0.2, very_quiet=True, silent_failure=True)
+    wait(lambda: not obj.is_displayed, timeout=timeout, name='not displayed')
 
 
-def wait_to_spinner_disappear(browser, timeout='5s', very_quiet=True, silent_failure=True):
-    def _is_disappeared(browser):
-        return len(browser.elements(locator='//*[contains(@class, " spinner ")]',
-                                    parent='//*[contains(@class, "navbar")]')) == 0
-    wait_for(
-        _is_disappeared, func_args=[browser], timeout=timeout,
-        delay=0.2, very_quiet=very_quiet, silent_failure=silent_failure)
+def wait_to_spinner_disappear(browser, timeout='5s', very_quiet=True, silent_failure=True,
+                              in_browser=False):
+    """ Waits to spinner disappear, returns immediately when there is no spinner.
+    Args:
+        in_browser: check spinner in the browser on every DOM change, instead of polling,
+            for the long waits like page loads
+    """
+    def _is_disappeared():
+        return len(browser.elements(locator=SPINNER, parent=SPINNER_PARENT)) == 0
+    if in_browser:
+        if _is_disappeared():
+            return
+        wait_in_browser(
+            browser.selenium,
+            'return document.evaluate(\'{}\', document, null, '
+            'XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue === null;'.format(
+                SPINNER_PARENT + SPINNER),
+            timeout=timeout, name='spinner', very_quiet=very_quiet,
+            silent_failure=silent_failure)
+    else:
+        wait(_is_disappeared, timeout=timeout, name='spinner', very_quiet=very_quiet,
+             silent_failure=silent_failure)
 
 
 class Button(Widget):
@@ -222,6 +238,28 @@ class DropDown(Widget):
                              '//*[contains(@class, "disabled")]//*[contains(@role, "option")]')
     OPTION = ('//*[contains(@class, "pf-c-select__menu")]'
               '//*[contains(@role, "option") and text()="{}"]')
+    # returns texts of enabled (arguments[0]) and disabled (arguments[1]) option elements,
+    # on filter drop down, title comes in to options list, it is removed here
+    SNAPSHOT_SCRIPT = """
+        var texts = function (elements) {
+            return elements.filter(function (el) {
+                return (el.getAttribute('title') || '').indexOf('Filter by') !== 0;
+            }).map(function (el) {
+                return (el.innerText || el.textContent || '').trim();
+            });
+        };
+        return {options: texts(arguments[0]), disabled: texts(arguments[1])};
+    """
+    # returns index of the first of elements (arguments[0]) with text arguments[1], or -1
+    INDEX_SCRIPT = """
+        for (var i = 0; i < arguments[0].length; i++) {
+            if ((arguments[0][i].innerText || arguments[0][i].textContent || '').trim() ===
+                    arguments[1]) {
+                return i;
+            }
+        }
+        return -1;
+    """
 
     def __init__(self, parent, force_open=True, locator=None, logger=None):
         Widget.__init__(self, parent, logger=logger)
@@ -248,55 +286,80 @@ class DropDown(Widget):
         wait_displayed(el)
         self.browser.click(el)
 
-    def _update_options(self, locator):
-        options = []
+    @property
+    def _snapshot_key(self):
+        return (type(self).__name__, getattr(self.parent, 'locator', None),
+                self.locator, self.SELECT_BUTTON, self.OPTIONS_LIST)
+
+    def _read_snapshot(self):
         if self._force_open:
             self._open()
-        for el in self.browser.elements(locator=self.locator + locator, parent=self):
-            # on filter drop down, title comes in to options list.
-            # Here it will be removed
-            if self.browser.get_attribute('title', el).startswith('Filter by'):
-                continue
-            options.append(self.browser.text(el))
-        if self._force_open:
-            self._close()
-        return options
+        try:
+            _enabled = self.browser.elements(
+                locator=self.locator + self.OPTIONS_LIST, parent=self)
+            _disabled = self.browser.elements(
+                locator=self.locator + self.DISABLED_OPTIONS_LIST, parent=self)
+            if len(_enabled) + len(_disabled) == 0:
+                return {'options': [], 'disabled': []}
+            return self.browser.execute_script(
+                self.SNAPSHOT_SCRIPT, _enabled, _disabled, silent=True)
+        finally:
+            if self._force_open:
+                self._close()
 
-    @property
-    def options(self):
-        options = []
+    def snapshot(self, force_read=False):
+        """
+        Returns enabled and disabled options read together with a single open.
+        Snapshot is cached until the page url changes, page is refreshed
+        or an option of any drop down is selected.
 
+        Returns
+        -------
+        dict with 'options' and 'disabled' lists of option texts
+        """
+        _snapshot = None if force_read else self.browser.option_snapshot(self._snapshot_key)
+        if _snapshot is not None:
+            return _snapshot
         # sometime options are not displayed, needs to do retry
         for retry in range(1, 3):  # @UnusedVariable
-            options = self._update_options(self.OPTIONS_LIST)
-            if len(options) > 0:
+            _snapshot = self._read_snapshot()
+            if len(_snapshot['options']) + len(_snapshot['disabled']) > 0:
+                self.browser.store_option_snapshot(self._snapshot_key, _snapshot)
                 break
-        return options
+        return _snapshot
 
     @property
-    def disabled_options(self):
-        options = []
+    def options(self):
+        return list(self.snapshot()['options'])
 
-        # sometime options are not displayed, needs to do retry
-        for retry in range(1, 3):  # @UnusedVariable
-            options = self._update_options(self.DISABLED_OPTIONS_LIST)
-            if len(options) > 0:
-                break
-        return options
+    @property
+    def disabled_options(self):
+        return list(self.snapshot()['disabled'])
 
     def select(self, option):
+        _snapshot = self.browser.option_snapshot(self._snapshot_key)
         self._open()
         try:
             self.browser.element(self.OPTION.format(option), parent=self.locator).click()
         except NoSuchElementException:
-            for element in self.browser.elements(self.OPTIONS_LIST, parent=self.locator):
+            if _snapshot is not None and option not in _snapshot['options']:
+                self.logger.debug('Option "{}" is not in {}'.format(option, _snapshot['options']))
+            else:
+                _elements = self.browser.elements(self.OPTIONS_LIST, parent=self.locator)
                 try:
-                    if element.text == option:
-                        element.click()
+                    # text of the elements is compared in the browser, in a single call
+                    _index = self.browser.execute_script(
+                        self.INDEX_SCRIPT, _elements, option, silent=True) \
+                        if len(_elements) > 0 else -1
+                    if _index >= 0:
+                        _elements[_index].click()
                 # in some of dropdown, when we select options page reloads.
                 # reload leads this issue
                 except StaleElementReferenceException:
                     pass
+        # selection can change content of this and the other drop downs,
+        # e.g. action can disable itself without changing the url
+        self.browser.invalidate_option_snapshots()
 
     @property
     def selected(self):
@@ -941,6 +1004,16 @@ class CheckBoxFilter(Widget):
     ITEM = './/label/span[normalize-space(text())="{}"]/../input'
     RB_ITEMS = './/label/input[@type="radio"]/..'
     DROP_DOWN = '//*[contains(@class, "dropdown")]/*[@id="{}"]/..'
+    # returns [text, checked] of every CB_ITEMS element passed as arguments[0],
+    # checkbox is inside of the item or it is a sibling of the item
+    STATES_SCRIPT = """
+        return arguments[0].map(function (item) {
+            var input = item.querySelector('input[type="checkbox"]') ||
+                item.parentNode.querySelector('input[type="checkbox"]');
+            return [(item.textContent || '').replace(/\\s+/g, ' ').trim(),
+                    input ? input.checked : false];
+        });
+    """
 
     def __init__(self, parent, filter_name, locator=None, logger=None):
         Widget.__init__(self, parent, logger=logger)
@@ -1021,25 +1094,63 @@ class CheckBoxFilter(Widget):
         self._cb_action(filter_name, 'fill', False)
 
     def uncheck_all(self):
-        self.open()
-        _items = self._items
-        for _cb_item in _items:
-            self._cb_action(_cb_item, 'fill', False, skipOpen=True)
-        self.close()
+        self.set_checked([])
 
     def is_checked(self, filter_name, skipOpen=False):
         return self._cb_action(filter_name, 'read', skipOpen=skipOpen)
 
+    def _states(self):
+        """
+        Optimized method, filter should be opened before calling.
+        Returns list of (item name, checked) read with a single script call.
+        """
+        _elements = self.browser.elements(parent=self, locator=self.CB_ITEMS)
+        if len(_elements) == 0:
+            return []
+        return [(_name, _checked) for _name, _checked in self.browser.execute_script(
+            self.STATES_SCRIPT, _elements, silent=True)]
+
+    def set_checked(self, names):
+        """
+        Checks supplied items and unchecks all the others.
+        Filter is opened and closed only once, only items which differ are toggled.
+
+        Parameters
+        ----------
+        names : list
+            A list of item names which should be checked.
+
+        Returns
+        -------
+        list of item names which were toggled
+        """
+        self.open()
+        try:
+            _states = self._states()
+            _changed = []
+            for _name, _checked in _states:
+                if (_name in names) != _checked:
+                    self._cb_action(_name, 'fill', not _checked, skipOpen=True)
+                    _changed.append(_name)
+            # names which are not listed fail the same way as check() does
+            _listed = [_name for _name, _checked in _states]
+            for _name in names:
+                if _name not in _listed:
+                    self._cb_action(_name, 'fill', True, skipOpen=True)
+                    _changed.append(_name)
+            if len(_changed) > 0:
+                wait_to_spinner_disappear(self.browser)
+            return _changed
+        finally:
+            self.close()
+
     @property
     def checked_items(self):
         self.open()
-        _items = self._items
-        checked_items = []
-        for _cb_item in _items:
-            if self.is_checked(_cb_item, skipOpen=True):
-                checked_items.append(_cb_item)
-        self.close()
-        return checked_items
+        try:
+            return [_name for _name, _checked in self._states() if _checked]
+        finally:
+            self.close()
 
 
 class NamespaceFilter(CheckBoxFilter):
@@ -1291,6 +1402,88 @@ class ListViewAbstract(Widget):
     CONFIG_TAB_OVERVIEW = './/button[@id="pf-tab-0-basic-tabs"]'
     ACTIVE_TAB_YAML = './/li[contains(@class, "pf-m-current")]//button[@id="pf-tab-1-basic-tabs"]'
     CONFIG_TAB_YAML = './/button[@id="pf-tab-1-basic-tabs"]'
+    ITEM_BADGE = './/*[contains(@class, "pf-c-badge")]'
+    ITEM_HEALTH_ICONS = [
+        ('healthy', HealthType.HEALTHY, './/*[contains(@class, "icon-healthy")]'),
+        ('failure', HealthType.FAILURE, './/*[contains(@class, "icon-failure")]'),
+        ('degraded', HealthType.DEGRADED, './/*[contains(@class, "icon-degraded")]'),
+        ('na', HealthType.NA, './/*[contains(@class, "icon-na")]')]
+    ITEM_VALIDATION_ICONS = [
+        ('valid', IstioConfigValidation.VALID,
+         './/*[contains(@style, "color: rgb(62, 134, 53)")]'),
+        ('not_valid', IstioConfigValidation.NOT_VALID, './/*[contains(@style, "danger")]'),
+        ('warning', IstioConfigValidation.WARNING, './/*[contains(@style, "warning")]')]
+    DETAILS_HEALTH_ICONS = [
+        (_key, _health, _locator + '/../..//h3[normalize-space(text())="Health"]')
+        for _key, _health, _locator in ITEM_HEALTH_ICONS]
+    DETAILS_VALIDATION_ICONS = [
+        ('not_valid', IstioConfigValidation.NOT_VALID, './/*[contains(@class, "ace_error")]'),
+        ('warning', IstioConfigValidation.WARNING, './/*[contains(@class, "ace_warning")]')]
+    MESH_WIDE_TLS_ICONS = [
+        ('full', MeshWideTLSType.ENABLED,
+         '//*[contains(@class, "pf-l-toolbar")]//img[contains(@src, "mtls-status-full")]'),
+        ('partial', MeshWideTLSType.PARTLY_ENABLED,
+         '//*[contains(@class, "pf-l-toolbar")]//img[contains(@src, "mtls-status-partial")]')]
+    NAMESPACE_WIDE_TLS_ICONS = [
+        ('full', MeshWideTLSType.ENABLED,
+         './/*[contains(@class, "pf-c-title")]//img[contains(@src, "mtls-status-full-dark")]'),
+        ('partial', MeshWideTLSType.PARTLY_ENABLED,
+         './/*[contains(@class, "pf-c-title")]//img[contains(@src, "mtls-status-partial-dark")]')]
+    # check presence of all the icons with one call
+    # arguments: parent element or null for whole page, dict of icon name and xpath
+    ICONS_SCRIPT = """
+        var context = arguments[0] || document, xpaths = arguments[1], flags = {};
+        for (var key in xpaths) {
+            flags[key] = document.evaluate(xpaths[key], context, null,
+                                           XPathResult.FIRST_ORDERED_NODE_TYPE,
+                                           null).singleNodeValue !== null;
+        }
+        return flags;
+    """
+    # read all the visible rows with one call, instead of one call per cell and icon
+    # arguments: list root, rows, cells, name link in a cell, badges in a cell,
+    # dict of flag name and xpath which presence is checked in a row
+    ROWS_SCRIPT = """
+        function find(xpath, context) {
+            var result = document.evaluate(xpath, context, null,
+                                           XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < result.snapshotLength; i++) {
+                nodes.push(result.snapshotItem(i));
+            }
+            return nodes;
+        }
+        function text(node) {
+            return (node.innerText || node.textContent || '').trim();
+        }
+        var cellXpath = arguments[2], linkXpath = arguments[3], badgeXpath = arguments[4];
+        var flagXpaths = arguments[5];
+        return find(arguments[1], arguments[0]).map(function (row) {
+            var cells = find(cellXpath, row);
+            var flags = {};
+            for (var key in flagXpaths) {
+                flags[key] = find(flagXpaths[key], row).length > 0;
+            }
+            return {
+                cells: cells.map(text),
+                links: cells.map(function (cell) {
+                    var links = find(linkXpath, cell);
+                    return links.length > 0 ? text(links[0]) : null;
+                }),
+                badges: cells.map(function (cell) {
+                    return find(badgeXpath, cell).map(text);
+                }),
+                flags: flags
+            };
+        });
+    """
+    # when False, items are read element by element with WebDriver calls
+    BATCHED_ITEMS = True
+    # maximum seconds to wait for rows to change after scroll, and polling interval
+    SCROLL_TIMEOUT = 0.5
+    SCROLL_POLL = 0.05
+    # flags of which at least one is present in a row when it is fully rendered
+    ROW_RENDERED_FLAGS = tuple(_key for _key, _health, _locator in ITEM_HEALTH_ICONS)
 
     def __init__(self, parent, locator=None, logger=None):
         Widget.__init__(self, parent, logger=logger)
@@ -1302,6 +1495,54 @@ class ListViewAbstract(Widget):
     def __locator__(self):
         return self.locator
 
+    def _row_records(self):
+        """ Returns records of visible rows: texts of 'cells', name 'links' and 'badges'
+        of each cell and 'flags' with presence of sidecar, health and validation icons """
+        _flags = {'missing_sidecar': self.MISSING_SIDECAR}
+        for _key, _health, _locator in self.ITEM_HEALTH_ICONS:
+            _flags[_key] = _locator
+        for _key, _validation, _locator in self.ITEM_VALIDATION_ICONS:
+            _flags[_key] = _locator
+        return self.browser.execute_script(self.ROWS_SCRIPT,
+                                           self.browser.element(self),
+                                           self.ITEMS,
+                                           self.ITEM_COL,
+                                           self.ITEM_TEXT,
+                                           self.ITEM_BADGE,
+                                           _flags,
+                                           silent=True)
+
+    def _classify(self, icons, parent=None, default=None):
+        """ Returns value of the first of icons present in parent, default if none is present.
+        All the icons are checked with one script call.
+        Args:
+            icons: list of (key, value, locator) ordered by priority
+            parent: element to search in, whole page when None
+            default: value returned when no icon is present
+        """
+        _flags = self.browser.execute_script(
+            self.ICONS_SCRIPT,
+            parent,
+            dict((_key, _locator) for _key, _value, _locator in icons),
+            silent=True)
+        return self._first_icon(_flags, icons, default)
+
+    def _first_icon(self, flags, icons, default=None):
+        for _key, _value, _locator in icons:
+            if flags[_key]:
+                return _value
+        return default
+
+    def _record_health(self, record):
+        return self._first_icon(record['flags'], self.ITEM_HEALTH_ICONS)
+
+    def _record_validation(self, record):
+        return self._first_icon(record['flags'], self.ITEM_VALIDATION_ICONS,
+                                IstioConfigValidation.NA)
+
+    def _record_namespace(self, record):
+        return record['cells'][1].strip().replace('NS', '')
+
     def has_overview_tab(self):
         return len(self.browser.elements(locator=self.CONFIG_TAB_OVERVIEW,
                                          parent=self.CONFIG_TABS_PARENT)) > 0
@@ -1335,80 +1576,26 @@ class ListViewAbstract(Widget):
             parent=self.DETAILS_ROOT,
             locator=self.MISSING_SIDECAR)) > 0
 
+    def _classify_details(self, icons, default=None):
+        """ Classifies icons inside of DETAILS_ROOT, default when it is not present """
+        _roots = self.browser.elements(self.DETAILS_ROOT)
+        if not _roots:
+            return default
+        return self._classify(icons, parent=_roots[0], default=default)
+
     def _get_details_health(self):
-        _health_sublocator = '/../..//h3[normalize-space(text())="Health"]'
-        _healthy = len(self.browser.elements(
-            parent=self.DETAILS_ROOT,
-            locator='.//*[contains(@class, "icon-healthy")]' + _health_sublocator)) > 0
-        _not_healthy = len(self.browser.elements(
-            parent=self.DETAILS_ROOT,
-            locator='.//*[contains(@class, "icon-failure")]' + _health_sublocator)) > 0
-        _degraded = len(self.browser.elements(
-            parent=self.DETAILS_ROOT,
-            locator='.//*[contains(@class, "icon-degraded")]' + _health_sublocator)) > 0
-        _not_available = len(self.browser.elements(
-            parent=self.DETAILS_ROOT,
-            locator='.//*[contains(@class, "icon-na")]' + _health_sublocator)) > 0
-        _health = None
-        if _healthy:
-            _health = HealthType.HEALTHY
-        elif _not_healthy:
-            _health = HealthType.FAILURE
-        elif _degraded:
-            _health = HealthType.DEGRADED
-        elif _not_available:
-            _health = HealthType.NA
-        return _health
+        return self._classify_details(self.DETAILS_HEALTH_ICONS)
 
     def _get_item_health(self, element):
-        _healthy = len(self.browser.elements(
-            parent=element,
-            locator='.//*[contains(@class, "icon-healthy")]')) > 0
-        _not_healthy = len(self.browser.elements(
-            parent=element,
-            locator='.//*[contains(@class, "icon-failure")]')) > 0
-        _degraded = len(self.browser.elements(
-            parent=element,
-            locator='.//*[contains(@class, "icon-degraded")]')) > 0
-        _not_available = len(self.browser.elements(
-            parent=element,
-            locator='.//*[contains(@class, "icon-na")]')) > 0
-        _health = None
-        if _healthy:
-            _health = HealthType.HEALTHY
-        elif _not_healthy:
-            _health = HealthType.FAILURE
-        elif _degraded:
-            _health = HealthType.DEGRADED
-        elif _not_available:
-            _health = HealthType.NA
-        return _health
+        return self._classify(self.ITEM_HEALTH_ICONS, parent=element)
 
     def _get_item_validation(self, element):
-        _valid = len(self.browser.elements(
-            parent=element,
-            locator='.//*[contains(@style, "color: rgb(62, 134, 53)")]')) > 0
-        _not_valid = len(self.browser.elements(
-            parent=element,
-            locator='.//*[contains(@style, "danger")]')) > 0
-        _warning = len(self.browser.elements(
-            parent=element,
-            locator='.//*[contains(@style, "warning")]')) > 0
-        return get_validation(_valid, _not_valid, _warning)
+        return self._classify(self.ITEM_VALIDATION_ICONS, parent=element,
+                              default=IstioConfigValidation.NA)
 
     def _get_details_validation(self):
-        _not_valid = len(self.browser.elements(
-            parent=self.DETAILS_ROOT,
-            locator='.//*[contains(@class, "ace_error")]')) > 0
-        _warning = len(self.browser.elements(
-            parent=self.DETAILS_ROOT,
-            locator='.//*[contains(@class, "ace_warning")]')) > 0
-        if _not_valid:
-            return IstioConfigValidation.NOT_VALID
-        elif _warning:
-            return IstioConfigValidation.WARNING
-        else:
-            return IstioConfigValidation.VALID
+        return self._classify_details(self.DETAILS_VALIDATION_ICONS,
+                                      default=IstioConfigValidation.VALID)
 
     def _get_item_label_keys(self, element):
         _label_keys = []
@@ -1471,39 +1658,76 @@ class ListViewAbstract(Widget):
         self.browser.refresh()
         wait_to_spinner_disappear(self.browser)
         wait_displayed(self)
-        _partial = len(self.browser.elements(
-            parent=self.ROOT,
-            locator='//*[contains(@class, "pf-l-toolbar")]'
-            '//img[contains(@src, "mtls-status-partial")]')) > 0
-        _full = len(self.browser.elements(
-            parent=self.ROOT,
-            locator='//*[contains(@class, "pf-l-toolbar")]'
-            '//img[contains(@src, "mtls-status-full")]')) > 0
-        if _full:
-            return MeshWideTLSType.ENABLED
-        elif _partial:
-            return MeshWideTLSType.PARTLY_ENABLED
-        else:
-            return MeshWideTLSType.DISABLED
+        return self._classify(self.MESH_WIDE_TLS_ICONS, default=MeshWideTLSType.DISABLED)
 
     def get_namespace_wide_tls(self, element):
-        _partial = len(self.browser.elements(
-            parent=element,
-            locator='.//*[contains(@class, "pf-c-title")]'
-            '//img[contains(@src, "mtls-status-partial-dark")]')) > 0
-        _full = len(self.browser.elements(
-            parent=element,
-            locator='.//*[contains(@class, "pf-c-title")]'
-            '//img[contains(@src, "mtls-status-full-dark")]')) > 0
-        if _full:
-            return MeshWideTLSType.ENABLED
-        elif _partial:
-            return MeshWideTLSType.PARTLY_ENABLED
-        else:
-            return MeshWideTLSType.DISABLED
+        return self._classify(self.NAMESPACE_WIDE_TLS_ICONS, parent=element,
+                              default=MeshWideTLSType.DISABLED)
 
     @property
     def all_items(self):
+        if not self.BATCHED_ITEMS:
+            return self._all_items_by_elements()
+        # refresh only when scrolled, so we are sure we are at the top of the page
+        if self._get_scroll_top() > 0:
+            self.browser.refresh()
+            wait_to_spinner_disappear(self.browser, in_browser=True)
+        wait_displayed(self)
+        height = self._get_height()
+        prev_height = 0
+        scroll_size = self.browser.element(self.ROOT).size['height']
+        scroll_height = 0
+        # there is no spinner shown while rendering, wait for rows instead
+        _records = self._wait_rows_changed([], timeout=self.SCROLL_TIMEOUT)
+        # rows are parsed once, when they are seen for the first time or their icons change
+        _items = {}
+        self._collect_records(_records, _items)
+        while prev_height != height or scroll_height - height < scroll_size:
+            prev_height = height
+            scroll_height += scroll_size
+            self.browser.execute_script(
+                "document.getElementsByClassName(\"pf-c-window-scroller\")[0].scroll(0, "
+                + str(scroll_height) + ");")
+            height = self._get_height()
+            _records = self._wait_rows_changed(_records, timeout=self.SCROLL_TIMEOUT)
+            self._collect_records(_records, _items)
+        return set(_item for _signature, _item in _items.values())
+
+    def _collect_records(self, records, items):
+        """ Updates items, dict of row cells to (row icons and badges, item) """
+        for _record in records:
+            _key = tuple(_record['cells'])
+            _signature = (sorted(_record['flags'].items()), _record['badges'])
+            if _key not in items or items[_key][0] != _signature:
+                items[_key] = (_signature, self._record_to_item(_record))
+
+    def _is_row_rendered(self, record):
+        if not self.ROW_RENDERED_FLAGS:
+            return True
+        return any(record['flags'].get(_flag) for _flag in self.ROW_RENDERED_FLAGS)
+
+    def _wait_rows_changed(self, records, timeout):
+        """ Polls visible rows until they differ from given records and all of them
+        are rendered, or timeout passes. Returns the last read rows."""
+        _previous = [_record['cells'] for _record in records]
+        _end = time() + timeout
+        _records = self._row_records()
+        while ([_record['cells'] for _record in _records] == _previous
+               or not all(self._is_row_rendered(_record) for _record in _records)) \
+                and time() < _end:
+            sleep(self.SCROLL_POLL)
+            _records = self._row_records()
+        return _records
+
+    def _get_scroll_top(self):
+        return self.browser.execute_script(
+            "var scroller = document.getElementsByClassName(\"pf-c-window-scroller\")[0];"
+            "return scroller ? scroller.scrollTop : 0;")
+
+    def _record_to_item(self, record):
+        raise NotImplementedError('Should be implemented on sub class')
+
+    def _all_items_by_elements(self):
         # always refresh the windown so we are sure we are at the top of the page before scrolling
         self.browser.refresh()
         wait_to_spinner_disappear(self.browser)
@@ -1598,6 +1822,12 @@ class ListViewOverview(ListViewAbstract):
 
 class ListViewApplications(ListViewAbstract):
 
+    def _record_to_item(self, record):
+        return Application(name=record['links'][0],
+                           namespace=self._record_namespace(record),
+                           istio_sidecar=not record['flags']['missing_sidecar'],
+                           health=self._record_health(record))
+
     def get_details(self, load_only=False):
         if load_only:
             return BreadCrumb(self.parent)
@@ -1628,6 +1858,8 @@ class ListViewApplications(ListViewAbstract):
 
     @property
     def items(self):
+        if self.BATCHED_ITEMS:
+            return [self._record_to_item(_record) for _record in self._row_records()]
         _items = []
         for el in self.browser.elements(self.ITEMS, parent=self):
             columns = self.browser.elements(self.ITEM_COL, parent=el)
@@ -1648,6 +1880,15 @@ class ListViewApplications(ListViewAbstract):
 
 class ListViewWorkloads(ListViewAbstract):
 
+    def _record_to_item(self, record):
+        return Workload(name=record['links'][0],
+                        namespace=self._record_namespace(record),
+                        workload_type=record['cells'][2],
+                        istio_sidecar=not record['flags']['missing_sidecar'],
+                        app_label='app' in record['badges'][5],
+                        version_label='version' in record['badges'][5],
+                        health=self._record_health(record))
+
     def get_details(self, load_only=False):
         if load_only:
             return BreadCrumb(self.parent)
@@ -1692,6 +1933,8 @@ class ListViewWorkloads(ListViewAbstract):
 
     @property
     def items(self):
+        if self.BATCHED_ITEMS:
+            return [self._record_to_item(_record) for _record in self._row_records()]
         _items = []
         for el in self.browser.elements(self.ITEMS, parent=self):
             # get workload name and namespace
@@ -1716,6 +1959,12 @@ class ListViewWorkloads(ListViewAbstract):
 
 class ListViewServices(ListViewAbstract):
 
+    def _record_to_item(self, record):
+        return Service(name=record['links'][0],
+                       namespace=self._record_namespace(record),
+                       istio_sidecar=not record['flags']['missing_sidecar'],
+                       health=self._record_health(record))
+
     def get_details(self, load_only=False):
         if load_only:
             return BreadCrumb(self.parent)
@@ -1767,6 +2016,8 @@ class ListViewServices(ListViewAbstract):
 
     @property
     def items(self):
+        if self.BATCHED_ITEMS:
+            return [self._record_to_item(_record) for _record in self._row_records()]
         _items = []
         for el in self.browser.elements(self.ITEMS, parent=self):
             # get rule name and namespace
@@ -1795,23 +2046,47 @@ class ListViewServices(ListViewAbstract):
 
 
 class ListViewIstioConfig(ListViewAbstract):
+    # configs without validation have no icon
+    ROW_RENDERED_FLAGS = ()
     ACTION_HEADER = ('.//*[contains(@class, "list-group-item-text")]'
                      '//strong[normalize-space(text())="{}"]/..')
     CONFIG_HEADER = './/div[contains(@class, "row")]//h4'
-    CONFIG_TEXT = './/div[contains(@class, "ace_content")]'
+    CONFIG_EDITOR = './/div[contains(@class, "ace_editor")]'
+    # ace renders only the visible lines, whole document is taken from the editor
+    EDITOR_VALUE_SCRIPT = 'return ace.edit(arguments[0]).getValue();'
     CONFIG_DETAILS_ROOT = './/div[contains(@class, "container-fluid")]'
 
     def get_details(self, name, load_only=False):
         if load_only:
             return BreadCrumb(self.parent)
         self.display_yaml_editor()
-        _text = self.browser.text(locator=self.CONFIG_TEXT,
-                                  parent=self.CONFIG_DETAILS_ROOT)
+        _text = self.browser.execute_script(
+            self.EDITOR_VALUE_SCRIPT,
+            self.browser.element(locator=self.CONFIG_EDITOR, parent=self.CONFIG_DETAILS_ROOT),
+            silent=True)
         return IstioConfigDetails(name=name, text=_text,
                                   validation=self._get_details_validation())
 
+    def _record_to_item(self, record):
+        _name = record['links'][0]
+        _namespace = self._record_namespace(record)
+        _object_type = record['cells'][2]
+        if self._is_rule(_object_type):
+            return Rule(name=_name, namespace=_namespace, object_type=_object_type)
+        return IstioConfig(name=_name,
+                           namespace=_namespace,
+                           object_type=_object_type,
+                           validation=self._record_validation(record))
+
+    def _is_rule(self, object_type):
+        return str(object_type) == IstioConfigObjectType.RULE.text or \
+            '{}: '.format(IstioConfigObjectType.ADAPTER.text) in str(object_type) or \
+            '{}: '.format(IstioConfigObjectType.TEMPLATE.text) in str(object_type)
+
     @property
     def items(self):
+        if self.BATCHED_ITEMS:
+            return [self._record_to_item(_record) for _record in self._row_records()]
         _items = []
         for el in self.browser.elements(self.ITEMS, parent=self):
             # get rule name and namespace
@@ -1821,9 +2096,7 @@ class ListViewIstioConfig(ListViewAbstract):
             _namespace = self._item_namespace(columns[1])
             _object_type = columns[2].text.strip()
 
-            if str(_object_type) == IstioConfigObjectType.RULE.text or \
-                    '{}: '.format(IstioConfigObjectType.ADAPTER.text) in str(_object_type) or \
-                    '{}: '.format(IstioConfigObjectType.TEMPLATE.text) in str(_object_type):
+            if self._is_rule(_object_type):
                 _rule = Rule(name=_name, namespace=_namespace, object_type=_object_type)
                 # append this item to the final list
                 _items.append(_rule)
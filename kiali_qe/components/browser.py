@@ -9,6 +9,30 @@ class KialiBrowser(Browser):
             plugin_class=None, logger=None, extra_objects=None):
         Browser.__init__(self, selenium, plugin_class=None, logger=None, extra_objects=None)
         self.kiali_versions = kiali_versions
+        # drop down option snapshots, key: drop down key, value: (url, snapshot)
+        self._option_snapshots = {}
+
+    def refresh(self):
+        self.invalidate_option_snapshots()
+        Browser.refresh(self)
+
+    def option_snapshot(self, key):
+        """ Returns cached drop down options snapshot or None,
+        snapshot is valid only on the url where it was taken """
+        if key not in self._option_snapshots:
+            return None
+        _url, _snapshot = self._option_snapshots[key]
+        if _url != self.url:
+            del self._option_snapshots[key]
+            return None
+        return _snapshot
+
+    def store_option_snapshot(self, key, snapshot):
+        self._option_snapshots[key] = (self.url, snapshot)
+
+    def invalidate_option_snapshots(self):
+        """ Removes all the drop down snapshots """
+        self._option_snapshots.clear()
 
     @property
     def product_version(self):
@@ -2,6 +2,47 @@ from kiali_qe.components.enums import HealthType
 
 
 class EntityBase(object):
+    """
+    Base of all the entities.
+
+    Sub classes can declare KEY_FIELDS and ADVANCED_FIELDS instead of implementing is_equal.
+    Then basic check compares KEY_FIELDS, advanced check compares ADVANCED_FIELDS as well,
+    and the entities get __eq__ and __hash__ based on them.
+    Key and hash are computed once, entities must not be modified after they are created.
+    """
+    __slots__ = ('_key', '_hash')
+    # fields which identify the entity, compared by basic check
+    KEY_FIELDS = ()
+    # fields compared by advanced check, in addition to KEY_FIELDS
+    ADVANCED_FIELDS = ()
+
+    @property
+    def key(self):
+        try:
+            return self._key
+        except AttributeError:
+            self._key = tuple(getattr(self, _field) for _field in self.KEY_FIELDS)
+            return self._key
+
+    def __hash__(self):
+        if not self.KEY_FIELDS:
+            return object.__hash__(self)
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(self.key)
+            return self._hash
+
+    def __eq__(self, other):
+        if not self.KEY_FIELDS:
+            return NotImplemented
+        return self.is_equal(other, advanced_check=True)
+
+    def __ne__(self, other):
+        _equal = self.__eq__(other)
+        if _equal is NotImplemented:
+            return _equal
+        return not _equal
 
     def is_in(self, items):
         for item in items:
@@ -9,8 +50,18 @@ class EntityBase(object):
                 return True
         return False
 
-    def is_equal(self, item):
-        raise NotImplementedError('Should be implemented on sub class')
+    def is_equal(self, other, advanced_check=True):
+        if not self.KEY_FIELDS:
+            raise NotImplementedError('Should be implemented on sub class')
+        if not isinstance(other, type(self)):
+            return False
+        if self.key != other.key:
+            return False
+        if advanced_check:
+            for _field in self.ADVANCED_FIELDS:
+                if getattr(self, _field) != getattr(other, _field):
+                    return False
+        return True
 
 
 class Requests(EntityBase):
@@ -103,6 +154,8 @@ class DeploymentStatus(EntityBase):
 
 
 class TrafficItem(EntityBase):
+    __slots__ = ('name', 'status', 'object_type', 'request_type', 'traffic')
+    KEY_FIELDS = ('name', 'object_type', 'status', 'request_type')
 
     def __init__(self, status, name, object_type, request_type, traffic):
         self.name = name
@@ -119,10 +172,3 @@ class TrafficItem(EntityBase):
         return "{}({}, {}, {}, {})".format(
             type(self).__name__, repr(self.name), repr(self.object_type),
             repr(self.status), repr(self.request_type))
-
-    def is_equal(self, other):
-        return isinstance(other, TrafficItem)\
-         and self.name == other.name\
-         and self.object_type == other.object_type\
-         and self.status == other.status\
-         and self.request_type == other.request_type
@@ -68,6 +68,10 @@ class ApplicationHealth(EntityBase):
 
 
 class Application(EntityBase):
+    __slots__ = ('name', 'namespace', 'istio_sidecar', 'health')
+    KEY_FIELDS = ('namespace', 'name')
+    # istio_sidecar is not compared
+    ADVANCED_FIELDS = ('health',)
 
     def __init__(self, name, namespace, istio_sidecar=None, health=None):
         self.name = name
@@ -84,28 +88,6 @@ class Application(EntityBase):
             type(self).__name__, repr(self.name), repr(self.namespace),
             repr(self.istio_sidecar), repr(self.health))
 
-    def __hash__(self):
-        return (hash(self.name) ^ hash(self.namespace) ^ hash(self.istio_sidecar))
-
-    def __eq__(self, other):
-        return self.is_equal(other, advanced_check=True)
-
-    def is_equal(self, other, advanced_check=True):
-        # basic check
-        if not isinstance(other, Application):
-            return False
-        if self.name != other.name:
-            return False
-        if self.namespace != other.namespace:
-            return False
-        # if self.istio_sidecar != other.istio_sidecar:
-        #    return False
-        # advanced check
-        if advanced_check:
-            if self.health != other.health:
-                return False
-        return True
-
 
 class ApplicationDetails(EntityBase):
 
@@ -3,6 +3,9 @@ from kiali_qe.utils import is_equal
 
 
 class IstioConfig(EntityBase):
+    __slots__ = ('name', 'namespace', 'object_type', 'validation')
+    KEY_FIELDS = ('namespace', 'name')
+    ADVANCED_FIELDS = ('object_type', 'validation')
 
     def __init__(self, name, namespace, object_type, validation=None):
         self.name = name
@@ -19,28 +22,6 @@ class IstioConfig(EntityBase):
             type(self).__name__, repr(self.name), repr(self.namespace),
             repr(self.object_type), repr(self.validation))
 
-    def __eq__(self, other):
-        return self.is_equal(other, advanced_check=True)
-
-    def __hash__(self):
-        return (hash(self.name) ^ hash(self.namespace) ^ hash(self.object_type))
-
-    def is_equal(self, other, advanced_check=True):
-        # basic check
-        if not isinstance(other, IstioConfig):
-            return False
-        if self.name != other.name:
-            return False
-        if self.namespace != other.namespace:
-            return False
-        # advanced check
-        if advanced_check:
-            if self.object_type != other.object_type:
-                return False
-            if self.validation != other.validation:
-                return False
-        return True
-
 
 class IstioConfigDetails(EntityBase):
 
@@ -103,6 +84,8 @@ class Action(EntityBase):
 
 
 class Rule(EntityBase):
+    __slots__ = ('name', 'namespace', 'object_type')
+    KEY_FIELDS = ('namespace', 'name', 'object_type')
 
     def __init__(self, name, namespace, object_type):
         self.name = name
@@ -116,23 +99,3 @@ class Rule(EntityBase):
     def __repr__(self):
         return "{}({}, {}, {})".format(
             type(self).__name__, repr(self.name), repr(self.namespace), repr(self.object_type))
-
-    def __hash__(self):
-        return (hash(self.name) ^ hash(self.namespace))
-
-    def __eq__(self, other):
-        return self.is_equal(other, advanced_check=True)
-
-    def is_equal(self, other, advanced_check=True):
-        # basic check
-        if not isinstance(other, Rule):
-            return False
-        if self.name != other.name:
-            return False
-        if self.namespace != other.namespace:
-            return False
-        if self.object_type != other.object_type:
-            return False
-        if not advanced_check:
-            return True
-        return True
@@ -3,6 +3,10 @@ from kiali_qe.components.enums import MeshWideTLSType
 
 
 class Overview(EntityBase):
+    __slots__ = ('overview_type', 'namespace', 'items',
+                 'healthy', 'unhealthy', 'degraded', 'na', 'tls_type')
+    KEY_FIELDS = ('overview_type', 'namespace', 'items')
+    ADVANCED_FIELDS = ('healthy', 'unhealthy', 'degraded', 'na')
 
     def __init__(self, overview_type, namespace, items,
                  healthy=0, unhealthy=0, degraded=0, na=0,
@@ -28,28 +32,3 @@ class Overview(EntityBase):
             type(self).__name__, repr(self.overview_type), repr(self.namespace), repr(self.items),
             repr(self.healthy), repr(self.unhealthy), repr(self.degraded), repr(self.na),
             repr(self.tls_type))
-
-    def __eq__(self, other):
-        return self.is_equal(other, advanced_check=True)
-
-    def is_equal(self, other, advanced_check=True):
-        # basic check
-        if not isinstance(other, Overview):
-            return False
-        if self.overview_type != other.overview_type:
-            return False
-        if self.namespace != other.namespace:
-            return False
-        if self.items != other.items:
-            return False
-        # advanced check
-        if advanced_check:
-            if self.healthy != other.healthy:
-                return False
-            if self.unhealthy != other.unhealthy:
-                return False
-            if self.degraded != other.degraded:
-                return False
-            if self.na != other.na:
-                return False
-        return True
@@ -68,6 +68,10 @@ class Service(EntityBase):
         version_label: version label
         health: health status
     """
+    __slots__ = ('name', 'namespace', 'istio_sidecar', 'app_label', 'version_label', 'health')
+    KEY_FIELDS = ('namespace', 'name')
+    # istio_sidecar is not compared
+    ADVANCED_FIELDS = ('health',)
 
     def __init__(self, name, namespace, istio_sidecar=None,
                  app_label=None, version_label=None, health=None):
@@ -95,29 +99,6 @@ class Service(EntityBase):
             repr(self.istio_sidecar), repr(self.app_label),
             repr(self.version_label), repr(self.health))
 
-    def __hash__(self):
-        return (hash(self.name) ^ hash(self.namespace) ^ hash(self.istio_sidecar))
-
-    def __eq__(self, other):
-        return self.is_equal(other, advanced_check=True)
-
-    def is_equal(self, other, advanced_check=True):
-        # basic check
-        if not isinstance(other, Service):
-            return False
-        if self.name != other.name:
-            return False
-        if self.namespace != other.namespace:
-            return False
-        # advanced check
-        if not advanced_check:
-            return True
-        # if self.istio_sidecar != other.istio_sidecar:
-        #    return False
-        if self.health != other.health:
-            return False
-        return True
-
 
 class ServiceDetails(EntityBase):
     """
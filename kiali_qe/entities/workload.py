@@ -3,6 +3,11 @@ from kiali_qe.components.enums import HealthType
 
 
 class Workload(EntityBase):
+    __slots__ = ('name', 'namespace', 'workload_type', 'istio_sidecar',
+                 'app_label', 'version_label', 'health')
+    KEY_FIELDS = ('namespace', 'name', 'workload_type')
+    # istio_sidecar is not compared
+    ADVANCED_FIELDS = ('health', 'app_label', 'version_label')
 
     def __init__(self, name, namespace, workload_type,
                  istio_sidecar=None, app_label=None, version_label=None, health=None):
@@ -26,34 +31,6 @@ class Workload(EntityBase):
             repr(self.istio_sidecar), repr(self.app_label),
             repr(self.version_label), repr(self.health))
 
-    def __eq__(self, other):
-        return self.is_equal(other, advanced_check=True)
-
-    def __hash__(self):
-        return (hash(self.name) ^ hash(self.namespace) ^ hash(self.workload_type))
-
-    def is_equal(self, other, advanced_check=True):
-        # basic check
-        if not isinstance(other, Workload):
-            return False
-        if self.name != other.name:
-            return False
-        if self.namespace != other.namespace:
-            return False
-        if self.workload_type != other.workload_type:
-            return False
-        # if self.istio_sidecar != other.istio_sidecar:
-        #    return False
-        # advanced check
-        if advanced_check:
-            if self.health != other.health:
-                return False
-            if self.app_label != other.app_label:
-                return False
-            if self.version_label != other.version_label:
-                return False
-        return True
-
 
 class WorkloadDetails(EntityBase):
 
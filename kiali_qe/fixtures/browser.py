@@ -1,5 +1,7 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from threading import Lock
 from time import sleep
 
 import pytest
@@ -8,15 +10,193 @@ from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.remote.remote_connection import RemoteConnection
 
 from kiali_qe.components.browser import KialiBrowser
-from kiali_qe.fixtures.zalenium import set_browser, update_suite_status
+from kiali_qe.fixtures.rest_client import create_kiali_client
+from kiali_qe.fixtures.zalenium import MASTER, set_browser, update_suite_status, worker_id
 from kiali_qe.utils.conf import env as cfg
+from kiali_qe.utils.executor import parallel_map
 from kiali_qe.utils.log import logger
 
 
+class BrowserPool(object):
+    """Web drivers of this process, pytest-xdist workers run in their own processes.
+
+    The driver of the browser fixture is created in advance, optionally in background.
+    With standby, one more driver is kept ready to replace a crashed session,
+    both drivers are created concurrently.
+    """
+
+    def __init__(self, worker=MASTER, standby=False):
+        """
+        Args:
+            worker: pytest-xdist worker id
+            standby: keep one more driver ready, it is re-created in background once used
+        """
+        self.worker = worker
+        self.standby = standby
+        self.browser = None
+        self._drivers = []
+        self._lock = Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._filling = None
+
+    def fill(self, size=None):
+        """Creates drivers concurrently, until there are size of them ready.
+        Default size is one, plus one when standby is enabled."""
+        if size is None:
+            size = 2 if self.standby else 1
+        with self._lock:
+            _missing = size - len(self._drivers)
+        if _missing <= 0:
+            return
+        _drivers = parallel_map(
+            lambda _index: _get_selenium(self.worker), range(_missing), _missing)
+        with self._lock:
+            self._drivers.extend([_driver for _driver in _drivers if _driver is not None])
+
+    def start(self, size=None, after=None):
+        """Starts filling of the pool in background, returns immediately.
+        Args:
+            size: see fill
+            after: future which has to succeed before drivers are created,
+                they are not created when it fails
+        """
+        with self._lock:
+            if self._filling is None or self._filling.done():
+                self._filling = self._executor.submit(self._fill_after, size, after)
+
+    def _fill_after(self, size, after):
+        if after is not None:
+            after.result()
+        self.fill(size)
+
+    def _wait_filled(self):
+        _filling = self._filling
+        if _filling is not None:
+            try:
+                _filling.result()
+            except Exception as ex:
+                logger.warn('Failed to create drivers in background. Exception:{}'.format(ex))
+
+    def acquire(self):
+        """Returns a pre-warmed driver, creates a new one when the pool is empty.
+        Caller is responsible for quitting the driver."""
+        self._wait_filled()
+        _driver = None
+        with self._lock:
+            if len(self._drivers) > 0:
+                _driver = self._drivers.pop(0)
+        if _driver is None:
+            _driver = _get_selenium(self.worker)
+        if self.standby:
+            # get ready the next standby while tests are running
+            self.start(1)
+        return _driver
+
+    def replace(self, kiali_browser):
+        """Replaces crashed web driver of kiali_browser with a driver from the pool."""
+        logger.warn('Web driver session is not responding, replacing it')
+        try:
+            kiali_browser.selenium.quit()
+        except WebDriverException:
+            pass
+        kiali_browser.selenium = self.acquire()
+        _open_kiali(kiali_browser.selenium)
+
+    def quit(self):
+        """Quits drivers which were not acquired, it can be called more times."""
+        self._wait_filled()
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            _drivers = self._drivers
+            self._drivers = []
+        for _driver in _drivers:
+            try:
+                _driver.quit()
+            except WebDriverException as ex:
+                logger.warn('Failed to quit driver. Exception:{}'.format(ex))
+
+
+def _create_pool(config):
+    return BrowserPool(worker=worker_id(config),
+                       standby=bool(cfg.selenium.standby))
+
+
+def pytest_collection_finish(session):
+    # create drivers in background while the rest of the session is set up,
+    # only when some test uses browser
+    if not cfg.selenium.async_start:
+        return
+    if not any('browser' in getattr(_item, 'fixturenames', ()) for _item in session.items):
+        return
+    # kiali client is created in its own thread, kiali_client fixture takes it from there
+    _client_executor = ThreadPoolExecutor(max_workers=1)
+    session.config.kiali_client_future = _client_executor.submit(create_kiali_client)
+    # the thread finishes the submitted call
+    _client_executor.shutdown(wait=False)
+    _pool = _create_pool(session.config)
+    session.config.browser_pool = _pool
+    # zalenium build capability is the kiali version, drivers wait for the client in
+    # their own thread, while the other session fixtures are set up
+    _pool.start(after=session.config.kiali_client_future)
+
+
+def pytest_unconfigure(config):
+    # background drivers are not quit by browser_pool fixture when it was not set up,
+    # when kiali client failed, no test used it or the run was interrupted
+    _pool = getattr(config, 'browser_pool', None)
+    if _pool is not None:
+        _pool.quit()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    yield
+    _pool = getattr(item.config, 'browser_pool', None)
+    if not _pool or not _pool.standby or _pool.browser is None:
+        return
+    if call.excinfo is not None and call.excinfo.errisinstance(WebDriverException) \
+            and not _is_alive(_pool.browser.selenium):
+        _pool.replace(_pool.browser)
+
+
+def _is_alive(selenium):
+    try:
+        selenium.current_url
+        return True
+    except WebDriverException:
+        return False
+
+
+@pytest.fixture(scope='session')
+def browser_pool(request, kiali_client):
+    _pool = getattr(request.config, 'browser_pool', None)
+    if _pool is None:
+        # kiali_client has updated zalenium build capability with kiali version
+        _pool = _create_pool(request.config)
+        request.config.browser_pool = _pool
+        _pool.fill()
+    yield _pool
+    _pool.quit()
+
+
 @pytest.fixture(scope='session')
-def browser(kiali_client):
-    selenium = _get_selenium()
-    selenium.maximize_window()
+def browser(request, browser_pool):
+    selenium = browser_pool.acquire()
+    # load KialiBrowser
+    kiali_browser = _launch_kiali(selenium)
+    browser_pool.browser = kiali_browser
+    set_browser(kiali_browser)
+    yield kiali_browser
+    # update suite status on zalenium
+    update_suite_status()
+    browser_pool.browser = None
+    kiali_browser.selenium.quit()
+
+
+def _open_kiali(selenium):
+    # headless window size is set by browser options
+    if not (cfg.selenium.mode == 'local' and cfg.selenium.local.headless):
+        selenium.maximize_window()
     logger.debug('Launching kiali instance: {}'.format(cfg.kiali.hostname))
     if cfg.kiali.auth_type == 'oauth':
         selenium.get(
@@ -25,20 +205,16 @@ def browser(kiali_client):
     else:
         selenium.get(
             'https://{}'.format(cfg.kiali.hostname))
-    # load KialiBrowser
-    kiali_browser = KialiBrowser(
+
+
+def _launch_kiali(selenium):
+    _open_kiali(selenium)
+    return KialiBrowser(
         selenium, logger=logger,
         kiali_versions={'core': cfg.kiali.version.core, 'console': cfg.kiali.version.console})
-    # ugly hack to pass browser object to zalenium fixtures
-    # needs to remove this global assignment
-    set_browser(kiali_browser)
-    yield kiali_browser
-    # update suite status on zalenium
-    update_suite_status()
-    kiali_browser.selenium.quit()
 
 
-def _get_selenium():
+def _get_selenium(worker=MASTER):
     # load desired_capabilities
     capabilities = {}
     for key, value in cfg.selenium.capabilities.items():
@@ -47,6 +223,9 @@ def _get_selenium():
                 capabilities['zal:' + z_key] = z_value
         else:   # update selenium capabilities
             capabilities[key] = value
+    # distinguish videos of pytest-xdist workers
+    if worker != MASTER and 'zal:name' in capabilities:
+        capabilities['zal:name'] = '{} [{}]'.format(capabilities['zal:name'], worker)
     logger.debug('Selenium configuration:\n{}'.format(json.dumps(cfg.selenium.toDict(), indent=2)))
     # load driver
     driver = None
@@ -65,6 +244,12 @@ def _get_selenium():
 
 
 def _get_driver(capabilities):
+    if cfg.selenium.mode == 'local':
+        return _get_local_driver()
+    return _get_remote_driver(capabilities)
+
+
+def _get_remote_driver(capabilities):
     logger.debug('Creating web driver')
     start_time = datetime.now()
     # set resolve_ip to false to make it work in cases when remote driver is running in OpenShift
@@ -86,13 +271,41 @@ def _get_driver(capabilities):
     return driver
 
 
-def _get_browser_options():
+def _get_local_driver():
+    # browser runs in this machine, driver binary has to be on PATH or configured
+    logger.debug('Creating local web driver')
+    start_time = datetime.now()
+    _options = _get_browser_options(headless=cfg.selenium.local.headless)
+    _driver_path = cfg.selenium.local.driver_path
+    if cfg.selenium.capabilities.browserName == "chrome":
+        driver = webdriver.Chrome(executable_path=_driver_path or 'chromedriver',
+                                  options=_options)
+    else:
+        driver = webdriver.Firefox(executable_path=_driver_path or 'geckodriver',
+                                   options=_options)
+    _delta = datetime.now() - start_time
+    logger.debug('Local web driver created successfully. Time taken: {} ms'.format(
+        int(_delta.total_seconds() * 1000)))
+    return driver
+
+
+def _get_browser_options(headless=False):
+    # headless browser can not be maximized, window size is set explicitly
+    _width, _height = (cfg.selenium.local.window_size or '1920x1080').split('x')
     if cfg.selenium.capabilities.browserName == "chrome":
         chrome_options = webdriver.ChromeOptions()
         chrome_options.add_argument("--incognito")
         chrome_options.add_experimental_option('w3c', False)
+        if headless:
+            chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--disable-gpu")
+            chrome_options.add_argument("--window-size={},{}".format(_width, _height))
         return chrome_options
     else:
         firefox_options = webdriver.FirefoxOptions()
         firefox_options.set_preference("browser.privatebrowsing.autostart", True)
+        if headless:
+            firefox_options.add_argument("-headless")
+            firefox_options.add_argument("--width={}".format(_width))
+            firefox_options.add_argument("--height={}".format(_height))
         return firefox_options
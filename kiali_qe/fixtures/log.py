@@ -4,6 +4,7 @@ import attr
 import pytest
 
 from kiali_qe.utils import log
+from kiali_qe.utils import wait
 
 #: A dict of tests, and their state at various test phases
 test_tracking = collections.defaultdict(dict)
@@ -78,6 +79,8 @@ def pytest_sessionfinish(session, exitstatus):
     summary = ', '.join(results)
     logger().info(log.format_marker('Finished test run', mark='='))
     logger().info(log.format_marker(str(summary), mark='='))
+    # show which waits burn the most time
+    wait.log_stats()
 
 
 def _test_status(test_name):
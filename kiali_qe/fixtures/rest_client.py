@@ -8,7 +8,16 @@ from kiali_qe.utils.log import logger
 
 
 @pytest.fixture(scope='session')
-def kiali_client():
+def kiali_client(request):
+    # with selenium.async_start, client is created in background together with web driver
+    _future = getattr(request.config, 'kiali_client_future', None)
+    if _future is not None:
+        return _future.result()
+    return create_kiali_client()
+
+
+def create_kiali_client():
+    """Creates kiali rest client, updates kiali versions and zalenium build in configuration"""
     logger.debug('Creating kiali rest client')
     logger.debug('Kiali hostname: {}'.format(cfg.kiali.hostname))
     _client = KialiExtendedClient(hostname=cfg.kiali.hostname,
@@ -16,7 +25,15 @@ def kiali_client():
                                   password=cfg.kiali.password,
                                   auth_type=cfg.kiali.auth_type,
                                   token=cfg.kiali.token,
-                                  swagger_address=cfg.kiali.swagger_address)
+                                  swagger_address=cfg.kiali.swagger_address,
+                                  bulk_health=cfg.kiali.rest.bulk_health,
+                                  max_workers=cfg.kiali.rest.max_workers,
+                                  pool_size=cfg.kiali.rest.pool_size,
+                                  timeout=cfg.kiali.rest.timeout,
+                                  retries=cfg.kiali.rest.retries,
+                                  backoff_factor=cfg.kiali.rest.backoff_factor,
+                                  cache_ttl=cfg.kiali.rest.cache.ttl,
+                                  cache_size=cfg.kiali.rest.cache.size)
     # update kiali version details
     _response = _client.get_response('getStatus')
     _status = _response['status']
@@ -39,9 +56,16 @@ def openshift_client():
     if cfg.kiali.skip_oc:
         logger.debug('Skipping Openshift rest client because of cfg.kiali.skip_oc')
         # TODO Temporary solution as OC client does not support OCP4
-        return kiali_client()
+        yield create_kiali_client()
     else:
         logger.debug('Creating Openshift rest client')
-        _client = OpenshiftExtendedClient()
+        _client = OpenshiftExtendedClient(
+            discovery_cache_dir=cfg.openshift.discovery_cache_dir,
+            max_workers=cfg.openshift.max_workers,
+            page_size=cfg.openshift.page_size)
+        _client.prewarm()
+        if cfg.openshift.informers:
+            _client.start_informers(cfg.openshift.informer_namespaces)
         logger.info('Openshift versions:\n{}'.format(json.dumps(_client.version, indent=2)))
-        return _client
+        yield _client
+        _client.stop_informers(timeout=5)
@@ -5,6 +5,9 @@ from kiali_qe.utils.log import logger
 ZALENIUM_MESSAGE = 'zaleniumMessage'
 ZALENIUM_TEST_STATUS = 'zaleniumTestPassed'
 
+# xdist worker id used when tests are not distributed
+MASTER = 'master'
+
 
 report = {
         'passed': [],
@@ -17,9 +20,19 @@ report = {
         'total': 0,
         }
 
+# every pytest-xdist worker runs in its own process, with its own browser and report
 _browser = None
 
 
+def worker_id(config):
+    """ Returns id of the pytest-xdist worker running in this process, MASTER without xdist """
+    # 'slaveinput' was used by older pytest-xdist versions
+    _input = getattr(config, 'workerinput', None) or getattr(config, 'slaveinput', None)
+    if _input:
+        return _input.get('workerid', MASTER)
+    return MASTER
+
+
 def set_browser(browser):
     global _browser
     _browser = browser
@@ -97,6 +97,7 @@ class RootPage(View):
         self.load()
 
     def page_refresh(self):
+        self.browser.invalidate_option_snapshots()
         self.browser.click(self.refresh)
 
     @property
@@ -0,0 +1,64 @@
+import time
+
+from collections import OrderedDict
+from threading import RLock
+
+
+class ResponseCache(object):
+    """Thread safe cache of REST responses with TTL expiry and LRU eviction.
+
+    Entries are keyed by (method_name, path, params). Cached responses are shared,
+    callers must not modify them.
+    """
+
+    def __init__(self, ttl=30, max_size=500):
+        """
+        Args:
+            ttl: seconds after which an entry expires
+            max_size: maximum number of entries, the least recently used are evicted
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = RLock()
+
+    @staticmethod
+    def key(method_name, path=None, params=None):
+        return (method_name,
+                tuple(sorted(path.items())) if path else (),
+                tuple(sorted(params.items())) if params else ())
+
+    def get_or_load(self, key, loader):
+        """Returns cached value of the key, calls loader and caches its result when
+        there is no valid entry."""
+        with self._lock:
+            if key in self._entries:
+                _expires, _value = self._entries[key]
+                if _expires > time.time():
+                    self.hits += 1
+                    # mark as recently used
+                    self._entries.pop(key)
+                    self._entries[key] = (_expires, _value)
+                    return _value
+                del self._entries[key]
+            self.misses += 1
+        # load outside of the lock to not serialize concurrent requests
+        _value = loader()
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.time() + self.ttl, _value)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return _value
+
+    def invalidate(self, namespace=None):
+        """Removes entries of the namespace, all the entries when namespace is None."""
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                return
+            for _key in list(self._entries.keys()):
+                if ('namespace', namespace) in _key[1]:
+                    del self._entries[_key]
@@ -0,0 +1,141 @@
+import time
+
+from threading import Condition, Event, Thread
+
+from kubernetes import watch
+
+from kiali_qe.utils.log import logger
+
+
+class ResourceInformer(object):
+    """Keeps a local copy of the objects of one resource kind in one namespace.
+
+    The store is filled by an initial LIST and kept current by a WATCH running in
+    a background thread. Objects are indexed by (namespace, name), namespace is None
+    for cluster wide resources.
+    """
+
+    def __init__(self, dyn_client, resource, namespace=None, watch_timeout=60, page_size=500):
+        """
+        Args:
+            dyn_client: openshift DynamicClient
+            resource: resource handle returned by dynamic client discovery
+            namespace: namespace of the objects, None for cluster wide resources
+            watch_timeout: seconds after which a WATCH request is renewed
+            page_size: maximum number of objects returned by one LIST request
+        """
+        self.resource = resource
+        self.namespace = namespace
+        self.watch_timeout = watch_timeout
+        self.page_size = page_size
+        self._dyn_client = dyn_client
+        self._store = {}
+        self._resource_version = None
+        self._condition = Condition()
+        self._stopped = Event()
+        self._watcher = None
+        self._thread = None
+
+    def start(self):
+        self._list()
+        self._thread = Thread(target=self._watch,
+                              name='informer-{}-{}'.format(self.resource.kind, self.namespace))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Stops the watch, waits for the thread up to timeout seconds when given."""
+        self._stopped.set()
+        _watcher = self._watcher
+        if _watcher is not None:
+            # stream ends at the next event or when the watch request times out
+            _watcher.stop()
+        if timeout is not None and self._thread is not None:
+            self._thread.join(timeout)
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _list(self):
+        # chunked by continue token, all the chunks are of the same resource version
+        _store = {}
+        _continue = None
+        while True:
+            _response = self.resource.get(namespace=self.namespace,
+                                          limit=self.page_size, _continue=_continue)
+            if hasattr(_response, 'items') and _response.items:
+                for _item in _response.items:
+                    _store[(_item.metadata.namespace, _item.metadata.name)] = _item
+            _continue = getattr(_response.metadata, 'continue', None)
+            if not _continue:
+                break
+        with self._condition:
+            self._store = _store
+            self._resource_version = _response.metadata.resourceVersion
+            self._condition.notify_all()
+
+    def _watch(self):
+        while not self._stopped.is_set():
+            self._watcher = watch.Watch()
+            try:
+                for _event in self._dyn_client.watch(self.resource,
+                                                     namespace=self.namespace,
+                                                     resource_version=self._resource_version,
+                                                     timeout=self.watch_timeout,
+                                                     watcher=self._watcher):
+                    if self._stopped.is_set():
+                        return
+                    if _event['type'] == 'ERROR':
+                        # usually resource version is too old, start from a fresh list
+                        raise Exception(_event['raw_object'])
+                    self._apply(_event)
+            except Exception as e:
+                if self._stopped.is_set():
+                    return
+                logger.debug('Watch of {} interrupted, listing again: {}'.format(
+                    self.resource.kind, e))
+                try:
+                    self._list()
+                except Exception as e:
+                    logger.debug('List of {} failed: {}'.format(self.resource.kind, e))
+                    self._stopped.wait(1)
+
+    def _apply(self, event):
+        _item = event['object']
+        with self._condition:
+            if event['type'] in ('ADDED', 'MODIFIED'):
+                self._store[(_item.metadata.namespace, _item.metadata.name)] = _item
+            elif event['type'] == 'DELETED':
+                self._store.pop((_item.metadata.namespace, _item.metadata.name), None)
+            self._resource_version = _item.metadata.resourceVersion
+            self._condition.notify_all()
+
+    def items(self, namespaces=[]):
+        """Returns objects of the namespaces, all of them when namespaces are empty."""
+        with self._condition:
+            if len(namespaces) > 0:
+                return [_item for _key, _item in self._store.items() if _key[0] in namespaces]
+            return list(self._store.values())
+
+    def get(self, namespace, name):
+        """Returns object or None when it does not exist."""
+        with self._condition:
+            return self._store.get((namespace, name))
+
+    def wait_for(self, condition, timeout=30):
+        """Waits until condition called with this informer returns True.
+        Args:
+            condition: function which takes the informer as an argument
+            timeout: seconds to wait
+        Returns:
+            True when the condition was met, False on timeout
+        """
+        _end = time.time() + timeout
+        with self._condition:
+            while not condition(self):
+                _remaining = _end - time.time()
+                if _remaining <= 0:
+                    return False
+                self._condition.wait(_remaining)
+            return True
@@ -34,8 +34,12 @@ from kiali_qe.entities.applications import (
     ApplicationHealth
 )
 from kiali_qe.entities.overview import Overview
+from kiali_qe.rest.cache import ResponseCache
+from kiali_qe.rest.session import PooledSession
 from kiali_qe.utils import to_linear_string
+from kiali_qe.utils.executor import BoundedExecutor
 from kiali_qe.utils.date import parse_from_rest, from_rest_to_ui
+from kiali_qe.utils.log import logger
 
 ISTIO_CONFIG_TYPES = {'DestinationRule': 'destinationrules',
                       'VirtualService': 'virtualservices',
@@ -50,9 +54,67 @@ ISTIO_CONFIG_TYPES = {'DestinationRule': 'destinationrules',
                       'ServiceRole': 'serviceroles',
                       'ServiceRoleBinding': 'servicerolebindings'}
 
+# istioConfigList keys of validated configs with their types
+ISTIO_CONFIG_LIST_TYPES = [
+    ('destinationRules', OBJECT_TYPE.DESTINATION_RULE, 'destinationrules'),
+    ('virtualServices', OBJECT_TYPE.VIRTUAL_SERVICE, 'virtualservices'),
+    ('quotaSpecs', OBJECT_TYPE.QUOTA_SPEC, 'quotaspecs'),
+    ('quotaSpecBindings', OBJECT_TYPE.QUOTA_SPEC_BINDING, 'quotaspecbindings'),
+    ('policies', OBJECT_TYPE.POLICY, 'policies'),
+    ('serviceMeshPolicies', OBJECT_TYPE.SERVICE_MESH_POLICY, 'servicemeshpolicies'),
+    ('gateways', OBJECT_TYPE.GATEWAY, 'gateways'),
+    ('serviceEntries', OBJECT_TYPE.SERVICE_ENTRY, 'serviceentries'),
+    ('serviceMeshRbacConfigs', OBJECT_TYPE.SERVICE_MESH_RBAC_CONFIG, 'servicemeshrbacconfigs'),
+    ('rbacConfigs', OBJECT_TYPE.RBAC_CONFIG, 'rbacconfigs'),
+    ('serviceRoles', OBJECT_TYPE.SERVICE_ROLE, 'serviceroles'),
+    ('serviceRoleBindings', OBJECT_TYPE.SERVICE_ROLE_BINDING, 'servicerolebindings')]
+
+# namespaceValidations object types, which are lower case kinds, to ISTIO_CONFIG_TYPES values
+VALIDATION_OBJECT_TYPES = dict((_kind.lower(), _config_type)
+                               for _kind, _config_type in ISTIO_CONFIG_TYPES.items())
+
 
 class KialiExtendedClient(KialiClient):
 
+    def __init__(self, *args, **kwargs):
+        """
+        Args:
+            bulk_health: when True, list methods load health of all the items in a
+                namespace with one request and join it to the list results.
+                Per item health requests are still used as a fallback.
+            max_workers: number of concurrent requests used by list methods
+                to fetch namespaces or items health/validation, 1 means serial.
+                Namespaces are fetched in parallel, items of a namespace are fetched
+                in parallel only when there is a single namespace.
+            pool_size: number of kept alive connections, when 0 or None
+                the kiali-client opens a new session for every request
+            timeout: seconds to wait for connect and for the response of each request
+            retries: maximum number of retries on connection errors and 5xx responses
+            backoff_factor: sleep between retries is backoff_factor * 2^(retry - 1) seconds
+            cache_ttl: seconds to keep GET responses in a cache, 0 or None disables the cache
+            cache_size: maximum number of cached responses
+        """
+        self.bulk_health = kwargs.pop('bulk_health', False)
+        self.max_workers = kwargs.pop('max_workers', 1)
+        self.executor = BoundedExecutor(self.max_workers)
+        _pool_size = kwargs.pop('pool_size', 10)
+        _timeout = kwargs.pop('timeout', 60)
+        _retries = kwargs.pop('retries', 3)
+        _backoff_factor = kwargs.pop('backoff_factor', 0.5)
+        _cache_ttl = kwargs.pop('cache_ttl', None)
+        _cache_size = kwargs.pop('cache_size', 500)
+        super(KialiExtendedClient, self).__init__(*args, **kwargs)
+        self.cache = ResponseCache(ttl=_cache_ttl, max_size=_cache_size) if _cache_ttl else None
+        self.session = None
+        if _pool_size:
+            self.session = PooledSession(auth=self.api_connector.auth,
+                                         cookies=self.api_connector.cookies,
+                                         verify=self.api_connector.verify,
+                                         pool_size=_pool_size,
+                                         timeout=_timeout,
+                                         retries=_retries,
+                                         backoff_factor=_backoff_factor)
+
     def namespace_list(self):
         """ Returns list of namespaces """
         entities = []
@@ -72,26 +134,9 @@ class KialiExtendedClient(KialiClient):
             namespaces: can be zero or any number of namespaces
         """
         items = []
-        namespace_list = []
-        if len(namespaces) > 0:
-            namespace_list.extend(namespaces)
-        else:
-            namespace_list = self.namespace_list()
         # update items
-        for _namespace in namespace_list:
-            _data = self.get_response('serviceList', path={'namespace': _namespace})
-            _services = _data['services']
-            # update all the services to our custom entity
-            for _service_rest in _services:
-                _service = Service(
-                    namespace=_namespace,
-                    name=_service_rest['name'],
-                    istio_sidecar=_service_rest['istioSidecar'],
-                    health=self.get_service_health(
-                        namespace=_namespace,
-                        service_name=_service_rest['name'],
-                        istioSidecar=_service_rest['istioSidecar']))
-                items.append(_service)
+        for _services in self._map_namespaces(self._namespace_service_list, namespaces):
+            items.extend(_services)
         # filter by service name
         if len(service_names) > 0:
             filtered_list = []
@@ -100,19 +145,32 @@ class KialiExtendedClient(KialiClient):
             return set(filtered_list)
         return items
 
+    def _namespace_service_list(self, namespace):
+        _data = self.get_response('serviceList', path={'namespace': namespace})
+        _services = _data['services']
+        _namespace_health = self.get_namespace_health(namespace, 'service') \
+            if self.bulk_health and _services else None
+
+        # update all the services to our custom entity
+        def _service(_service_rest):
+            return Service(
+                namespace=namespace,
+                name=_service_rest['name'],
+                istio_sidecar=_service_rest['istioSidecar'],
+                health=self.get_service_health(
+                    namespace=namespace,
+                    service_name=_service_rest['name'],
+                    istioSidecar=_service_rest['istioSidecar'],
+                    namespace_health=_namespace_health))
+        return self.executor.map(_service, _services)
+
     def overview_list(self, namespaces=[], overview_type=OverviewPageType.APPS):
         """Returns list of overviews.
         Args:
             namespaces: can be zero or any number of namespaces
         """
-        overviews = []
-        namespace_list = []
-        if len(namespaces) > 0:
-            namespace_list.extend(namespaces)
-        else:
-            namespace_list = self.namespace_list()
-        # update items
-        for _namespace in namespace_list:
+
+        def _overview(_namespace):
             if overview_type == OverviewPageType.SERVICES:
                 _items = self.service_list([_namespace])
             elif overview_type == OverviewPageType.WORKLOADS:
@@ -133,7 +191,7 @@ class KialiExtendedClient(KialiClient):
                     _unhealthy += 1
                 if _item.health == HEALTH_TYPE.NA:
                     _na += 1
-            _overview = Overview(
+            return Overview(
                 overview_type=overview_type.text,
                 namespace=_namespace,
                 items=len(_items),
@@ -141,8 +199,8 @@ class KialiExtendedClient(KialiClient):
                 unhealthy=_unhealthy,
                 degraded=_degraded,
                 na=_na)
-            overviews.append(_overview)
-        return overviews
+        # update items
+        return self._map_namespaces(_overview, namespaces)
 
     def application_list(self, namespaces=[], application_names=[]):
         """Returns list of applications.
@@ -151,25 +209,10 @@ class KialiExtendedClient(KialiClient):
             application_names: can be zero or any number of applications
         """
         items = []
-        namespace_list = []
-        if len(namespaces) > 0:
-            namespace_list.extend(namespaces)
-        else:
-            namespace_list = self.namespace_list()
         # update items
-        for _namespace in namespace_list:
-            _data = self.get_response('appList', path={'namespace': _namespace})
-            _applications = _data['applications']
-            if _applications:
-                for _application_rest in _applications:
-                    _application = Application(
-                        namespace=_namespace,
-                        name=_application_rest['name'],
-                        istio_sidecar=_application_rest['istioSidecar'],
-                        health=self.get_app_health(
-                            namespace=_namespace,
-                            app_name=_application_rest['name']))
-                    items.append(_application)
+        for _applications in self._map_namespaces(self._namespace_application_list,
+                                                  namespaces):
+            items.extend(_applications)
         # filter by application name
         if len(application_names) > 0:
             filtered_list = []
@@ -178,6 +221,25 @@ class KialiExtendedClient(KialiClient):
             return set(filtered_list)
         return items
 
+    def _namespace_application_list(self, namespace):
+        _data = self.get_response('appList', path={'namespace': namespace})
+        _applications = _data['applications']
+        if not _applications:
+            return []
+        _namespace_health = self.get_namespace_health(namespace, 'app') \
+            if self.bulk_health else None
+
+        def _application(_application_rest):
+            return Application(
+                namespace=namespace,
+                name=_application_rest['name'],
+                istio_sidecar=_application_rest['istioSidecar'],
+                health=self.get_app_health(
+                    namespace=namespace,
+                    app_name=_application_rest['name'],
+                    namespace_health=_namespace_health))
+        return self.executor.map(_application, _applications)
+
     def workload_list(self, namespaces=[], workload_names=[]):
         """Returns list of workloads.
         Args:
@@ -185,29 +247,9 @@ class KialiExtendedClient(KialiClient):
             workload_names: can be zero or any number of workloads
         """
         items = []
-        namespace_list = []
-        if len(namespaces) > 0:
-            namespace_list.extend(namespaces)
-        else:
-            namespace_list = self.namespace_list()
         # update items
-        for _namespace in namespace_list:
-            _data = self.get_response('workloadList', path={'namespace': _namespace})
-            _workloads = _data['workloads']
-            if _workloads:
-                for _workload_rest in _workloads:
-                    _labels = self.get_labels(_workload_rest)
-                    _workload = Workload(
-                        namespace=_namespace,
-                        name=_workload_rest['name'],
-                        workload_type=_workload_rest['type'],
-                        istio_sidecar=_workload_rest['istioSidecar'],
-                        app_label='app' in _labels.keys(),
-                        version_label='version' in _labels.keys(),
-                        health=self.get_workload_health(
-                            namespace=_namespace,
-                            workload_name=_workload_rest['name']))
-                    items.append(_workload)
+        for _workloads in self._map_namespaces(self._namespace_workload_list, namespaces):
+            items.extend(_workloads)
         # filter by workload name
         if len(workload_names) > 0:
             filtered_list = []
@@ -216,194 +258,38 @@ class KialiExtendedClient(KialiClient):
             return set(filtered_list)
         return items
 
+    def _namespace_workload_list(self, namespace):
+        _data = self.get_response('workloadList', path={'namespace': namespace})
+        _workloads = _data['workloads']
+        if not _workloads:
+            return []
+        _namespace_health = self.get_namespace_health(namespace, 'workload') \
+            if self.bulk_health else None
+
+        def _workload(_workload_rest):
+            _labels = self.get_labels(_workload_rest)
+            return Workload(
+                namespace=namespace,
+                name=_workload_rest['name'],
+                workload_type=_workload_rest['type'],
+                istio_sidecar=_workload_rest['istioSidecar'],
+                app_label='app' in _labels.keys(),
+                version_label='version' in _labels.keys(),
+                health=self.get_workload_health(
+                    namespace=namespace,
+                    workload_name=_workload_rest['name'],
+                    namespace_health=_namespace_health))
+        return self.executor.map(_workload, _workloads)
+
     def istio_config_list(self, namespaces=[], config_names=[]):
         """Returns list of istio config.
         Args:
             namespaces: can be zero or any number of namespaces
         """
         items = []
-        namespace_list = []
-        if len(namespaces) > 0:
-            namespace_list.extend(namespaces)
-        else:
-            namespace_list = self.namespace_list()
         # update items
-        for _namespace in namespace_list:
-            _data = self.get_response('istioConfigList', path={'namespace': _namespace})
-
-            # update DestinationRule
-            if len(_data['destinationRules']) > 0 and len(_data['destinationRules']['items']) > 0:
-                for _policy in _data['destinationRules']['items']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.DESTINATION_RULE.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'destinationrules',
-                                                                    _policy['metadata']['name'])))
-
-            # update Rule
-            if len(_data['rules']) > 0:
-                for _policy in _data['rules']:
-                    items.append(Rule(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.RULE.text))
-
-            # update Rule with Adapter
-            if len(_data['adapters']) > 0:
-                for _policy in _data['adapters']:
-                    items.append(Rule(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type='{}: {}'.format(OBJECT_TYPE.ADAPTER.text, _policy['adapter'])))
-
-            # update Rule with Template
-            if len(_data['templates']) > 0:
-                for _policy in _data['templates']:
-                    items.append(Rule(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type='{}: {}'.format(
-                            OBJECT_TYPE.TEMPLATE.text, _policy['template'])))
-
-            # update VirtualService
-            if len(_data['virtualServices']) > 0 and len(_data['virtualServices']['items']) > 0:
-                for _policy in _data['virtualServices']['items']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.VIRTUAL_SERVICE.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'virtualservices',
-                                                                    _policy['metadata']['name'])))
-
-            # update QuotaSpec
-            if len(_data['quotaSpecs']) > 0:
-                for _policy in _data['quotaSpecs']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.QUOTA_SPEC.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'quotaspecs',
-                                                                    _policy['metadata']['name'])))
-
-            # update QuotaSpecBindings
-            if len(_data['quotaSpecBindings']) > 0:
-                for _policy in _data['quotaSpecBindings']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.QUOTA_SPEC_BINDING.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'quotaspecbindings',
-                                                                    _policy['metadata']['name'])))
-
-            # update Policy
-            if len(_data['policies']) > 0:
-                for _policy in _data['policies']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.POLICY.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'policies',
-                                                                    _policy['metadata']['name'])))
-
-            # update ServiceMeshPolicy
-            if len(_data['serviceMeshPolicies']) > 0:
-                for _policy in _data['serviceMeshPolicies']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.SERVICE_MESH_POLICY.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'servicemeshpolicies',
-                                                                    _policy['metadata']['name'])))
-
-            # update Gateway
-            if len(_data['gateways']) > 0:
-                for _policy in _data['gateways']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.GATEWAY.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'gateways',
-                                                                    _policy['metadata']['name'])))
-
-            # update serviceEntries
-            if len(_data['serviceEntries']) > 0:
-                for _policy in _data['serviceEntries']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.SERVICE_ENTRY.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'serviceentries',
-                                                                    _policy['metadata']['name'])))
-
-            # update serviceMeshRbacConfigs
-            if len(_data['serviceMeshRbacConfigs']) > 0:
-                for _policy in _data['serviceMeshRbacConfigs']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.SERVICE_MESH_RBAC_CONFIG.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'servicemeshrbacconfigs',
-                                                                    _policy['metadata']['name'])))
-
-            # update rbacConfigs
-            if len(_data['rbacConfigs']) > 0:
-                for _policy in _data['rbacConfigs']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.RBAC_CONFIG.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'rbacconfigs',
-                                                                    _policy['metadata']['name'])))
-
-            # update serviceRoles
-            if len(_data['serviceRoles']) > 0:
-                for _policy in _data['serviceRoles']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.SERVICE_ROLE.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'serviceroles',
-                                                                    _policy['metadata']['name'])))
-
-            # update serviceRoleBindings
-            if len(_data['serviceRoleBindings']) > 0:
-                for _policy in _data['serviceRoleBindings']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.SERVICE_ROLE_BINDING.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'servicerolebindings',
-                                                                    _policy['metadata']['name'])))
-
-            # not required at this stage. These options not availabe in UI
-            # # update all the rules to our custom entity
-            # for _rule_rest in _rules:
-            #     # update actions
-            #     _actions = []
-            #     for _action_r in _rule_rest['actions']:
-            #         _actions.append(Action.get_from_rest(_action_r))
-            #     _match = None
-            #     if 'match' in _rule_rest:
-            #         _match = _rule_rest['match']
-            #     _rule = Rule(
-            #         namespace=_namespace,
-            #         name=_rule_rest['name'],
-            #         actions=_actions,
-            #         match=_match)
-            #     items.append(_rule)
+        for _configs in self._map_namespaces(self._namespace_istio_config_list, namespaces):
+            items.extend(_configs)
 
         # apply filters
         if len(config_names) > 0:
@@ -413,6 +299,98 @@ class KialiExtendedClient(KialiClient):
             return set(name_filtered_list)
         return items
 
+    def _namespace_istio_config_list(self, namespace):
+        _rules = []
+        _data = self.get_response('istioConfigList', path={'namespace': namespace})
+
+        # update Rule
+        if len(_data['rules']) > 0:
+            for _policy in _data['rules']:
+                _rules.append(Rule(
+                    name=_policy['metadata']['name'],
+                    namespace=namespace,
+                    object_type=OBJECT_TYPE.RULE.text))
+
+        # update Rule with Adapter
+        if len(_data['adapters']) > 0:
+            for _policy in _data['adapters']:
+                _rules.append(Rule(
+                    name=_policy['metadata']['name'],
+                    namespace=namespace,
+                    object_type='{}: {}'.format(OBJECT_TYPE.ADAPTER.text, _policy['adapter'])))
+
+        # update Rule with Template
+        if len(_data['templates']) > 0:
+            for _policy in _data['templates']:
+                _rules.append(Rule(
+                    name=_policy['metadata']['name'],
+                    namespace=namespace,
+                    object_type='{}: {}'.format(
+                        OBJECT_TYPE.TEMPLATE.text, _policy['template'])))
+
+        # update validated configs, DestinationRule, VirtualService, QuotaSpec, etc.
+        _configs = []
+        for _key, _object_type, _config_type in ISTIO_CONFIG_LIST_TYPES:
+            _policies = _data[_key]
+            # DestinationRules and VirtualServices are wrapped into a list object
+            if isinstance(_policies, dict):
+                _policies = _policies.get('items')
+            if _policies:
+                for _policy in _policies:
+                    _configs.append((_object_type, _config_type, _policy['metadata']['name']))
+
+        _validations = self.get_istio_config_validations(namespace) if _configs else None
+
+        def _config(_config_data):
+            _object_type, _config_type, _name = _config_data
+            return IstioConfig(
+                name=_name,
+                namespace=namespace,
+                object_type=_object_type.text,
+                validation=self.get_istio_config_validation(namespace,
+                                                            _config_type,
+                                                            _name,
+                                                            validations=_validations))
+        _istio_configs = self.executor.map(_config, _configs)
+
+        # listed in the original order, destination rules, rules and then the other configs
+        _destination_rules = len([_c for _c in _configs
+                                  if _c[0] == OBJECT_TYPE.DESTINATION_RULE])
+        items = _istio_configs[:_destination_rules] + _rules + _istio_configs[_destination_rules:]
+
+        # not required at this stage. These options not availabe in UI
+        # # update all the rules to our custom entity
+        # for _rule_rest in _rules:
+        #     # update actions
+        #     _actions = []
+        #     for _action_r in _rule_rest['actions']:
+        #         _actions.append(Action.get_from_rest(_action_r))
+        #     _match = None
+        #     if 'match' in _rule_rest:
+        #         _match = _rule_rest['match']
+        #     _rule = Rule(
+        #         namespace=_namespace,
+        #         name=_rule_rest['name'],
+        #         actions=_actions,
+        #         match=_match)
+        #     items.append(_rule)
+        return items
+
+    def _map_namespaces(self, func, namespaces=[]):
+        """Calls func for each of the namespaces concurrently.
+        Args:
+            func: function which takes namespace name as an argument
+            namespaces: can be zero or any number of namespaces, all when empty
+        Returns:
+            list of func results in the order of namespaces
+        """
+        namespace_list = []
+        if len(namespaces) > 0:
+            namespace_list.extend(namespaces)
+        else:
+            namespace_list = self.namespace_list()
+        return self.executor.map(func, namespace_list)
+
     def istio_config_details(self, namespace, object_type, object_name):
         """Returns details of istio config.
         Args:
@@ -480,16 +458,17 @@ class KialiExtendedClient(KialiClient):
                 config_data = _data['serviceRoleBinding']
 
             if config_data:
+                _validations = self.get_istio_config_validations(namespace)
+                _validation = self._istio_config_validation_data(namespace,
+                                                                 config_type,
+                                                                 object_name,
+                                                                 _validations)
                 config = IstioConfigDetails(
                     name=config_data['metadata']['name'],
                     _type=_data['objectType'],
                     text=json.dumps(config_data),
-                    validation=self.get_istio_config_validation(namespace,
-                                                                config_type,
-                                                                object_name),
-                    error_messages=self.get_istio_config_messages(namespace,
-                                                                  config_type,
-                                                                  object_name))
+                    validation=self._validation_status(_validation),
+                    error_messages=self._validation_messages(_validation))
         return config
 
     def service_details(self, namespace, service_name):
@@ -503,8 +482,17 @@ class KialiExtendedClient(KialiClient):
                                           path={'namespace': namespace, 'service': service_name})
         _service = None
         if _service_data:
-            _service_rest = self.service_list(namespaces=[namespace],
-                                              service_names=[service_name]).pop()
+            if 'istioSidecar' in _service_data:
+                _istio_sidecar = _service_data['istioSidecar']
+            else:
+                # older Kiali does not report sidecar in service details
+                _istio_sidecar = self._service_istio_sidecar(namespace, service_name)
+            _validations = {}
+
+            def _get_validations(_namespace):
+                if _namespace not in _validations:
+                    _validations[_namespace] = self.get_istio_config_validations(_namespace)
+                return _validations[_namespace]
             workloads = []
             if _service_data['workloads']:
                 for _wl_data in _service_data['workloads']:
@@ -545,7 +533,8 @@ class KialiExtendedClient(KialiClient):
                         status=self.get_istio_config_validation(
                             _vs_data['metadata']['namespace'],
                             'virtualservices',
-                            _vs_data['metadata']['name']),
+                            _vs_data['metadata']['name'],
+                            validations=_get_validations(_vs_data['metadata']['namespace'])),
                         name=_vs_data['metadata']['name'],
                         created_at=parse_from_rest(_vs_data['metadata']['creationTimestamp']),
                         resource_version=_vs_data['metadata']['resourceVersion'],
@@ -568,7 +557,8 @@ class KialiExtendedClient(KialiClient):
                         status=self.get_istio_config_validation(
                             _dr_data['metadata']['namespace'],
                             'destinationrules',
-                            _dr_data['metadata']['name']),
+                            _dr_data['metadata']['name'],
+                            validations=_get_validations(_dr_data['metadata']['namespace'])),
                         name=_dr_data['metadata']['name'],
                         host=_dr_data['spec']['host'],
                         traffic_policy=_traffic_policy if _traffic_policy else '',
@@ -582,7 +572,7 @@ class KialiExtendedClient(KialiClient):
                                               _port['port'])
             _service = ServiceDetails(
                     name=_service_data['service']['name'],
-                    istio_sidecar=_service_rest.istio_sidecar,
+                    istio_sidecar=_istio_sidecar,
                     created_at=parse_from_rest(
                         _service_data['service']['createdAt']),
                     resource_version=_service_data['service']['resourceVersion'],
@@ -594,13 +584,20 @@ class KialiExtendedClient(KialiClient):
                     health=self.get_service_health(
                         namespace=namespace,
                         service_name=service_name,
-                        istioSidecar=_service_rest.istio_sidecar),
+                        istioSidecar=_istio_sidecar),
                     workloads=workloads,
                     traffic=source_workloads,
                     virtual_services=virtual_services,
                     destination_rules=destination_rules)
         return _service
 
+    def _service_istio_sidecar(self, namespace, service_name):
+        _data = self.get_response('serviceList', path={'namespace': namespace})
+        for _service_rest in _data['services']:
+            if _service_rest['name'] == service_name:
+                return _service_rest['istioSidecar']
+        return False
+
     def workload_details(self, namespace, workload_name, workload_type):
         """Returns details of Workload.
         Args:
@@ -612,8 +609,6 @@ class KialiExtendedClient(KialiClient):
                                            path={'namespace': namespace, 'workload': workload_name})
         _workload = None
         if _workload_data:
-            _workload_rest = self.workload_list(namespaces=[namespace],
-                                                workload_names=[workload_name]).pop()
             _services = []
             if _workload_data['services']:
                 for _ws_data in _workload_data['services']:
@@ -697,7 +692,7 @@ class KialiExtendedClient(KialiClient):
 
             _workload = WorkloadDetails(
                 name=_workload_data['name'],
-                istio_sidecar=_workload_rest.istio_sidecar,
+                istio_sidecar=_workload_data['istioSidecar'],
                 workload_type=_workload_data['type'],
                 created_at=parse_from_rest(_workload_data['createdAt']),
                 resource_version=_workload_data['resourceVersion'],
@@ -724,8 +719,6 @@ class KialiExtendedClient(KialiClient):
                                                     'app': application_name})
         _application = None
         if _application_data:
-            _application_rest = self.application_list(namespaces=[namespace],
-                                                      application_names=[application_name]).pop()
             _workloads = []
             if _application_data['workloads']:
                 for _wl_data in _application_data['workloads']:
@@ -736,9 +729,10 @@ class KialiExtendedClient(KialiClient):
             if 'serviceNames' in _application_data:
                 for _service in _application_data['serviceNames']:
                     _services.append(_service)
+            # application has sidecar only when all its workloads have it, as in app list
             _application = ApplicationDetails(
                 name=_application_data['name'],
-                istio_sidecar=_application_rest.istio_sidecar,
+                istio_sidecar=all(_workload.istio_sidecar for _workload in _workloads),
                 health=self.get_app_health(
                             namespace=namespace,
                             app_name=_application_data['name']),
@@ -746,75 +740,168 @@ class KialiExtendedClient(KialiClient):
                 services=_services)
         return _application
 
+    def get_namespace_health(self, namespace, health_type,
+                             time_interval=TimeIntervalRestParam.LAST_MINUTE.text):
+        """Returns Health of all the items of given type in a namespace.
+        Args:
+            namespace: namespace where items are located
+            health_type: type of items, one of 'app', 'service', 'workload'
+            time_interval: The rate interval used for fetching error rate
+        Returns:
+            dict of item name and health data, None when the request failed
+        """
+        try:
+            return self.get_response(method_name='namespaceHealth',
+                                     path={'namespace': namespace},
+                                     params={'type': health_type,
+                                             'rateInterval': time_interval})
+        except Exception as e:
+            logger.warning('Failed to load {} health of namespace {}, '
+                           'falling back to per item requests: {}'.format(
+                               health_type, namespace, e))
+            return None
+
     def get_service_health(self, namespace, service_name, istioSidecar,
-                           time_interval=TimeIntervalRestParam.LAST_MINUTE.text):
+                           time_interval=TimeIntervalRestParam.LAST_MINUTE.text,
+                           namespace_health=None):
         """Returns Health of Service.
         Args:
             namespaces: namespace where Service is located
             service_name: name of Service
             time_interval: The rate interval used for fetching error rate
+            namespace_health: result of get_namespace_health, when given and it contains
+                the Service no request is made
         """
 
         if not istioSidecar:  # without sidecar no health is available
             return HEALTH_TYPE.NA
 
-        _health_data = self.get_response(method_name='serviceHealth',
-                                         path={'namespace': namespace, 'service': service_name},
-                                         params={'rateInterval': time_interval})
+        if namespace_health and service_name in namespace_health:
+            _health_data = namespace_health[service_name]
+        else:
+            _health_data = self.get_response(method_name='serviceHealth',
+                                             path={'namespace': namespace,
+                                                   'service': service_name},
+                                             params={'rateInterval': time_interval})
         if _health_data:
             return ServiceHealth.get_from_rest(_health_data).is_healthy()
         else:
             return None
 
     def get_workload_health(self, namespace, workload_name,
-                            time_interval=TimeIntervalRestParam.LAST_MINUTE.text):
+                            time_interval=TimeIntervalRestParam.LAST_MINUTE.text,
+                            namespace_health=None):
         """Returns Health of Workload.
         Args:
             namespaces: namespace where Workload is located
             workload_name: name of Workload
             time_interval: The rate interval used for fetching error rate
+            namespace_health: result of get_namespace_health, when given and it contains
+                the Workload no request is made
         """
 
-        _health_data = self.get_response(method_name='workloadHealth',
-                                         path={'namespace': namespace, 'workload': workload_name},
-                                         params={'rateInterval': time_interval})
+        if namespace_health and workload_name in namespace_health:
+            _health_data = namespace_health[workload_name]
+        else:
+            _health_data = self.get_response(method_name='workloadHealth',
+                                             path={'namespace': namespace,
+                                                   'workload': workload_name},
+                                             params={'rateInterval': time_interval})
         if _health_data:
             return WorkloadHealth.get_from_rest(_health_data).is_healthy()
         else:
             return None
 
     def get_app_health(self, namespace, app_name,
-                       time_interval=TimeIntervalRestParam.LAST_MINUTE.text):
+                       time_interval=TimeIntervalRestParam.LAST_MINUTE.text,
+                       namespace_health=None):
         """Returns Health of Application.
         Args:
             namespaces: namespace where Application is located
             workload_name: name of Application
             time_interval: The rate interval used for fetching error rate
+            namespace_health: result of get_namespace_health, when given and it contains
+                the Application no request is made
         """
 
-        _health_data = self.get_response(method_name='appHealth',
-                                         path={'namespace': namespace, 'app': app_name},
-                                         params={'rateInterval': time_interval})
+        if namespace_health and app_name in namespace_health:
+            _health_data = namespace_health[app_name]
+        else:
+            _health_data = self.get_response(method_name='appHealth',
+                                             path={'namespace': namespace, 'app': app_name},
+                                             params={'rateInterval': time_interval})
         if _health_data:
             return ApplicationHealth.get_from_rest(_health_data).is_healthy()
         else:
             return None
 
-    def get_istio_config_validation(self, namespace, object_type, object_name):
+    def get_istio_config_validations(self, namespace):
+        """Returns Validations of all the Istio Configs in a namespace.
+        Args:
+            namespaces: namespace where Configs are located
+        Returns:
+            dict of (object_type, object_name) and validation data,
+            where object_type is the same as in ISTIO_CONFIG_TYPES values,
+            None when the request failed
+        """
+        try:
+            _data = self.get_response('namespaceValidations', path={'namespace': namespace})
+        except Exception as e:
+            logger.warning('Failed to load validations of namespace {}, '
+                           'falling back to per object requests: {}'.format(namespace, e))
+            return None
+        _validations = {}
+        if _data and namespace in _data:
+            for _type, _objects in _data[namespace].items():
+                _config_type = VALIDATION_OBJECT_TYPES.get(_type.lower(), _type)
+                for _name, _validation in _objects.items():
+                    _validations[(_config_type, _name)] = _validation
+        return _validations
+
+    def get_istio_config_validation(self, namespace, object_type, object_name,
+                                    validations=None):
         """Returns Validation of Istio Config.
         Args:
             namespaces: namespace where Config is located
             object_type: type of the Config
             object: name of Config
+            validations: result of get_istio_config_validations, when given and it contains
+                the Config no request is made
         """
 
-        _health_data = self.get_validation('istioConfigDetails',
-                                           namespace=namespace,
-                                           object_type=object_type,
-                                           object=object_name)
-        if _health_data:
-            if len(_health_data['checks']) > 0:
-                if 'error' in set(check['severity'] for check in _health_data['checks']):
+        return self._validation_status(
+            self._istio_config_validation_data(namespace, object_type, object_name,
+                                               validations))
+
+    def get_istio_config_messages(self, namespace, object_type, object_name,
+                                  validations=None):
+        """Returns Validation Messages of Istio Config.
+        Args:
+            namespaces: namespace where Config is located
+            object_type: type of the Config
+            object: name of Config
+            validations: result of get_istio_config_validations, when given and it contains
+                the Config no request is made
+        """
+
+        return self._validation_messages(
+            self._istio_config_validation_data(namespace, object_type, object_name,
+                                               validations))
+
+    def _istio_config_validation_data(self, namespace, object_type, object_name,
+                                      validations=None):
+        if validations and (object_type, object_name) in validations:
+            return validations[(object_type, object_name)]
+        # not in the namespace validations, created after they were loaded for example
+        return self.get_validation('istioConfigDetails',
+                                   namespace=namespace,
+                                   object_type=object_type,
+                                   object=object_name)
+
+    def _validation_status(self, validation_data):
+        if validation_data:
+            if len(validation_data['checks']) > 0:
+                if 'error' in set(check['severity'] for check in validation_data['checks']):
                     return IstioConfigValidation.NOT_VALID
                 else:
                     return IstioConfigValidation.WARNING
@@ -823,22 +910,11 @@ class KialiExtendedClient(KialiClient):
         else:
             return IstioConfigValidation.NA
 
-    def get_istio_config_messages(self, namespace, object_type, object_name):
-        """Returns Validation Messages of Istio Config.
-        Args:
-            namespaces: namespace where Config is located
-            object_type: type of the Config
-            object: name of Config
-        """
+    def _validation_messages(self, validation_data):
         _error_messages = []
-
-        _health_data = self.get_validation('istioConfigDetails',
-                                           namespace=namespace,
-                                           object_type=object_type,
-                                           object=object_name)
-        if _health_data:
-            if len(_health_data['checks']) > 0:
-                for _check in _health_data['checks']:
+        if validation_data:
+            if len(validation_data['checks']) > 0:
+                for _check in validation_data['checks']:
                     _error_messages.append(_check['message'])
         return _error_messages
 
@@ -851,10 +927,12 @@ class KialiExtendedClient(KialiClient):
             api_version: Config api version (not used)
         """
 
-        return self.post_response('istioConfigCreate',
-                                  namespace=namespace,
-                                  object_type=ISTIO_CONFIG_TYPES[kind],
-                                  data=body)
+        _response = self.post_response('istioConfigCreate',
+                                       namespace=namespace,
+                                       object_type=ISTIO_CONFIG_TYPES[kind],
+                                       data=body)
+        self.invalidate_cache(namespace)
+        return _response
 
     def delete_istio_config(self, name, namespace, kind, api_version):
         """Deletes Istio Config.
@@ -865,10 +943,12 @@ class KialiExtendedClient(KialiClient):
             api_version: Config api version (not used)
         """
 
-        return self.delete_response('istioConfigDelete',
-                                    namespace=namespace,
-                                    object_type=ISTIO_CONFIG_TYPES[kind],
-                                    object=name)
+        _response = self.delete_response('istioConfigDelete',
+                                         namespace=namespace,
+                                         object_type=ISTIO_CONFIG_TYPES[kind],
+                                         object=name)
+        self.invalidate_cache(namespace)
+        return _response
 
     def get_labels(self, object_rest):
         _labels = {}
@@ -896,28 +976,58 @@ class KialiExtendedClient(KialiClient):
                     _labels[_subset['name']] = _values
         return _labels
 
+    def request(self, method_name=None, path=None, params=None, plain_url=None,
+                http_method='GET', data=None):
+        if not self.session:
+            return super(KialiExtendedClient, self).request(
+                method_name=method_name, path=path, params=params, plain_url=plain_url,
+                http_method=http_method, data=data)
+        if plain_url is None:
+            # params are already encoded into url by swagger parser
+            url = self.swagger_parser.construct_url(method_name, path, params)
+            params = None
+        else:
+            url = plain_url
+        return self.session.request(http_method=http_method,
+                                    url=self.api_connector.retrieve_url(url),
+                                    params=params,
+                                    data=data)
+
+    def connection_stats(self):
+        """Returns counters of new and reused connections, None when pooling is disabled."""
+        return self.session.stats() if self.session else None
+
+    def invalidate_cache(self, namespace=None):
+        """Removes cached responses of the namespace, all of them when namespace is None."""
+        if self.cache:
+            self.cache.invalidate(namespace)
+
     def get_response(self, method_name, path=None, params=None):
-        return super(KialiExtendedClient, self).request(method_name=method_name, path=path,
-                                                        params=params).json()
+        def _load():
+            return self.request(method_name=method_name, path=path, params=params).json()
+
+        if not self.cache:
+            return _load()
+        return self.cache.get_or_load(ResponseCache.key(method_name, path, params), _load)
 
     def post_response(self, method_name, data, **kwargs):
-        return super(KialiExtendedClient, self).request(
+        return self.request(
             method_name=method_name,
             path=kwargs,
             http_method="POST",
             data=json.dumps(data))
 
     def delete_response(self, method_name, **kwargs):
-        return super(KialiExtendedClient, self).request(
+        return self.request(
             method_name=method_name,
             path=kwargs,
             http_method="DELETE")
 
     def get_validation(self, method_name, **kwargs):
-        response = super(KialiExtendedClient, self).request(
+        response = self.get_response(
             method_name=method_name,
             path=kwargs,
-            params={'validate': 'true'}).json()
+            params={'validate': 'true'})
         return response['validation'] if 'validation' in response else None
 
     def get_pod_status(self, istioSidecar, pod_data):
@@ -1,5 +1,12 @@
+import hashlib
+import json
+import os
 import re
-from kubernetes import config
+import tempfile
+import time
+
+from threading import Lock
+from kubernetes import client, config
 from openshift.dynamic import DynamicClient
 from openshift.dynamic.exceptions import NotFoundError
 
@@ -12,7 +19,10 @@ from kiali_qe.entities.applications import (
     ApplicationDetails,
     AppWorkload
 )
+from kiali_qe.rest.informer import ResourceInformer
 from kiali_qe.utils.date import parse_from_rest
+from kiali_qe.utils.executor import parallel_map
+from kiali_qe.utils.log import logger
 
 
 class OpenshiftExtendedClient(object):
@@ -55,16 +65,183 @@ class OpenshiftExtendedClient(object):
 
     WORKLOAD_NAME_REGEX = re.compile('(-(\\w{1,8}\\d+\\w{1,8}))(-(\\w{0,7}\\d+\\w{0,7})$)?')
 
-    def __init__(self):
+    def __init__(self, discovery_cache_dir=None, max_workers=1, page_size=500):
+        """
+        Args:
+            discovery_cache_dir: directory of API discovery cache file, temp directory when
+                not set. The file is specific to cluster host and version, so repeated runs
+                against the same cluster skip the API discovery.
+            max_workers: number of concurrent LIST requests of different kinds,
+                1 means serial
+            page_size: maximum number of objects returned by one LIST request
+        """
+        self.max_workers = max_workers
+        self.page_size = page_size
         self._k8s_client = config.new_client_from_config()
-        self._dyn_client = DynamicClient(self._k8s_client)
+        self._dyn_client = DynamicClient(
+            self._k8s_client,
+            cache_file=self._discovery_cache_file(discovery_cache_dir))
+        self._resources = {}
+        self._resources_lock = Lock()
+        self._informers = {}
 
     @property
     def version(self):
         return self._dyn_client.version
 
+    def _discovery_cache_file(self, cache_dir=None):
+        try:
+            _version = client.VersionApi(self._k8s_client).get_code().git_version
+        except Exception as e:
+            logger.warning('Failed to get cluster version, using default discovery cache: {}'
+                           .format(e))
+            return None
+        _cache_id = '{}-{}'.format(self._k8s_client.configuration.host, _version)
+        return os.path.join(
+            cache_dir if cache_dir else tempfile.gettempdir(),
+            'kiali-qe-discovery-{}.json'.format(
+                hashlib.sha1(_cache_id.encode('utf-8')).hexdigest()))
+
     def _resource(self, kind, api_version='v1'):
-        return self._dyn_client.resources.get(kind=kind, api_version=api_version)
+        _key = (kind, api_version)
+        if _key not in self._resources:
+            with self._resources_lock:
+                if _key not in self._resources:
+                    self._resources[_key] = self._dyn_client.resources.get(
+                        kind=kind, api_version=api_version)
+        return self._resources[_key]
+
+    def _resource_attributes(self):
+        _attributes = ['_namespace', '_service']
+        _attributes.extend(self.WORKLOAD_TYPES.values())
+        _attributes.extend(self.CONFIG_TYPES.values())
+        return _attributes
+
+    def prewarm(self):
+        """Resolves all the resources used by this client, so tests do not pay for it."""
+        for _attribute in self._resource_attributes():
+            try:
+                getattr(self, _attribute)
+            except Exception as e:
+                # not all the resources are available on every cluster
+                logger.debug('Resource {} is not available: {}'.format(_attribute, e))
+
+    def start_informers(self, namespaces, watch_timeout=60):
+        """Starts informers for namespaces, services, workloads and istio configs.
+        Namespaced resources are watched only in the given namespaces.
+        List methods and namespace_exists answer from informers store afterwards,
+        requests for other namespaces are still sent as LIST requests.
+        Args:
+            namespaces: Namespaces to watch
+            watch_timeout: seconds after which a WATCH request is renewed
+        """
+        for _attribute in self._resource_attributes():
+            _informers = self._informers.setdefault(_attribute, {})
+            try:
+                _resource = getattr(self, _attribute)
+                for _namespace in (namespaces if _resource.namespaced else [None]):
+                    if _namespace in _informers:
+                        continue
+                    _informer = ResourceInformer(self._dyn_client, _resource,
+                                                 namespace=_namespace,
+                                                 watch_timeout=watch_timeout,
+                                                 page_size=self.page_size)
+                    _informer.start()
+                    _informers[_namespace] = _informer
+            except Exception as e:
+                # not all the resources are available on every cluster
+                logger.debug('Informer of {} is not available: {}'.format(_attribute, e))
+
+    def stop_informers(self, timeout=None):
+        """Stops all the informers, waits for their threads up to timeout seconds each."""
+        for _informers in self._informers.values():
+            for _informer in _informers.values():
+                _informer.stop(timeout=timeout)
+        self._informers = {}
+
+    def _attribute_informers(self, attribute_name, namespaces):
+        """Returns informers covering the namespaces, None when some is not watched."""
+        _informers = self._informers.get(attribute_name, {})
+        if None in _informers:
+            return [_informers[None]]
+        if len(namespaces) == 0 or any(_ns not in _informers for _ns in namespaces):
+            return None
+        return [_informers[_ns] for _ns in namespaces]
+
+    def _raw_items(self, attribute_name, namespaces=[]):
+        """ Yields raw objects of a resource from informer store or by LIST requests
+        LIST requests are chunked to page_size objects using continue token,
+        so big lists are not loaded into memory at once.
+        Args:
+            attribute_name: the attribute of class for getting resource
+            namespaces: Namespaces of the objects, all when empty
+        """
+        _informers = self._attribute_informers(attribute_name, namespaces)
+        if _informers is not None:
+            for _informer in _informers:
+                for _item in _informer.items(namespaces):
+                    yield _item
+            return
+        _resource = getattr(self, attribute_name)
+        for _namespace in (namespaces if len(namespaces) > 0 else [None]):
+            _continue = None
+            while True:
+                _response = _resource.get(namespace=_namespace,
+                                          limit=self.page_size,
+                                          _continue=_continue)
+                if not hasattr(_response, 'items') or not _response.items:
+                    break
+                for _item in _response.items:
+                    yield _item
+                _continue = getattr(_response.metadata, 'continue', None)
+                if not _continue:
+                    break
+
+    def _name_matches(self, name, names):
+        """ Name filters are substring matches which can not be pushed down to server
+        as field selectors support exact match only """
+        if len(names) == 0:
+            return True
+        for _name in names:
+            if _name in name:
+                return True
+        return False
+
+    def wait_for_istio_config(self, name, namespace, kind, api_version, exists=True,
+                              timeout=30):
+        """ Waits until Istio Config is created or deleted, using watch events when
+        informers are running, polling otherwise.
+        Args:
+            name: config name
+            namespace: Namespace of the config
+            kind: type of the Config
+            api_version: Config api version
+            exists: wait for creation when True, for deletion otherwise
+            timeout: seconds to wait
+        Returns:
+            True when the config reached the state, False on timeout
+        """
+        _resource = self._istio_config(kind=kind, api_version=api_version)
+        for _informers in self._informers.values():
+            _informer = _informers.get(namespace)
+            if _informer is not None and _informer.resource.kind == _resource.kind and \
+                    _informer.resource.group_version == _resource.group_version:
+                return _informer.wait_for(
+                    lambda _i: (_i.get(namespace, name) is not None) == exists,
+                    timeout=timeout)
+
+        def _config_exists():
+            try:
+                _resource.get(name=name, namespace=namespace)
+                return True
+            except NotFoundError:
+                return False
+        _end = time.time() + timeout
+        while _config_exists() != exists:
+            if time.time() > _end:
+                return False
+            time.sleep(0.5)
+        return True
 
     @property
     def _namespace(self):
@@ -199,6 +376,9 @@ class OpenshiftExtendedClient(object):
 
     def namespace_exists(self, namespace):
         """ Returns True if given namespace exists. False otherwise. """
+        _informers = self._attribute_informers('_namespace', [])
+        if _informers is not None:
+            return _informers[0].get(None, namespace) is not None
         try:
             self._namespace.get(name=namespace)
             return True
@@ -229,18 +409,12 @@ class OpenshiftExtendedClient(object):
         """ Returns list of services
         Args:
             namespace: Namespace of the service, optional
+            service_names: Names of the services, optional
         """
         items = []
-        _raw_items = []
-        if len(namespaces) > 0:
-            # update items
-            for _namespace in namespaces:
-                _response = self._service.get(namespace=_namespace)
-                _raw_items.extend(_response.items)
-        else:
-            _response = self._service.get()
-            _raw_items.extend(_response.items)
-        for _item in _raw_items:
+        for _item in self._raw_items('_service', namespaces):
+            if not self._name_matches(_item.metadata.name, service_names):
+                continue
             # update all the services to our custom entity
             # TODO: heath needs to be added
             _service = Service(
@@ -251,23 +425,24 @@ class OpenshiftExtendedClient(object):
                 version_label=self._get_label(_item, 'version'),
                 health=None)
             items.append(_service)
-        # filter by service name
+        # filtered by service name
         if len(service_names) > 0:
-            filtered_list = []
-            for _name in service_names:
-                filtered_list.extend([_i for _i in items if _name in _i.name])
-            return set(filtered_list)
+            return set(items)
         return items
 
     def workload_list(self, namespaces=[], workload_names=[]):
         """ Returns list of workloads """
         result = []
-        for _key, _value in self.WORKLOAD_TYPES.items():
+
+        def _workloads(_type):
+            _key, _value = _type
             # TODO apply Job filters
             # TODO apply Pod filters
-            result.extend(self._workload_list(_value, _key,
-                                              namespaces=namespaces,
-                                              workload_names=workload_names))
+            return self._workload_list(_value, _key,
+                                       namespaces=namespaces,
+                                       workload_names=workload_names)
+        for _items in parallel_map(_workloads, self.WORKLOAD_TYPES.items(), self.max_workers):
+            result.extend(_items)
 
         return result
 
@@ -281,18 +456,9 @@ class OpenshiftExtendedClient(object):
             workload_names: Names of the workloads, optional
         """
         items = []
-        _raw_items = []
-        if len(namespaces) > 0:
-            # update items
-            for _namespace in namespaces:
-                _response = getattr(self, attribute_name).get(namespace=_namespace)
-                if hasattr(_response, 'items'):
-                    _raw_items.extend(_response.items)
-        else:
-            _response = getattr(self, attribute_name).get()
-            if hasattr(_response, 'items'):
-                _raw_items.extend(_response.items)
-        for _item in _raw_items:
+        for _item in self._raw_items(attribute_name, namespaces):
+            if not self._name_matches(_item.metadata.name, workload_names):
+                continue
             # update all the workloads to our custom entity
             _workload = Workload(
                 name=_item.metadata.name,
@@ -302,12 +468,9 @@ class OpenshiftExtendedClient(object):
                 app_label=self._get_label(_item, 'app'),
                 version_label=self._get_label(_item, 'version'))
             items.append(_workload)
-        # filter by workload name
+        # filtered by workload name
         if len(workload_names) > 0:
-            filtered_list = []
-            for _name in workload_names:
-                filtered_list.extend([_i for _i in items if _name in _i.name])
-            return set(filtered_list)
+            return set(items)
         return items
 
     def _contains_sidecar(self, item):
@@ -342,10 +505,14 @@ class OpenshiftExtendedClient(object):
     def istio_config_list(self, namespaces=[], config_names=[]):
         """ Returns list of Istio Configs """
         result = []
-        for _key, _value in self.CONFIG_TYPES.items():
-            result.extend(self._resource_list(_value, _key,
-                                              namespaces=namespaces,
-                                              resource_names=config_names))
+
+        def _configs(_type):
+            _key, _value = _type
+            return self._resource_list(_value, _key,
+                                       namespaces=namespaces,
+                                       resource_names=config_names)
+        for _items in parallel_map(_configs, self.CONFIG_TYPES.items(), self.max_workers):
+            result.extend(_items)
         return result
 
     def _resource_list(self, attribute_name, resource_type,
@@ -359,18 +526,9 @@ class OpenshiftExtendedClient(object):
         """
         resource_type = re.sub(': .*', '', resource_type)
         items = []
-        _raw_items = []
-        if len(namespaces) > 0:
-            # update items
-            for _namespace in namespaces:
-                _response = getattr(self, attribute_name).get(namespace=_namespace)
-                if hasattr(_response, 'items'):
-                    _raw_items.extend(_response.items)
-        else:
-            _response = getattr(self, attribute_name).get()
-            if hasattr(_response, 'items'):
-                _raw_items.extend(_response.items)
-        for _item in _raw_items:
+        for _item in self._raw_items(attribute_name, namespaces):
+            if not self._name_matches(_item.metadata.name, resource_names):
+                continue
             if str(resource_type) == IstioConfigObjectType.RULE.text:
                 _rule = Rule(name=_item.metadata.name,
                              namespace=_item.metadata.namespace,
@@ -399,12 +557,9 @@ class OpenshiftExtendedClient(object):
                                       object_type=resource_type)
                 # append this item to the final list
                 items.append(_config)
-        # filter by resource name
+        # filtered by resource name
         if len(resource_names) > 0:
-            filtered_list = []
-            for _name in resource_names:
-                filtered_list.extend([_i for _i in items if _name in _i.name])
-            return set(filtered_list)
+            return set(items)
         return items
 
     def application_details(self, namespace, application_name):
@@ -506,7 +661,7 @@ class OpenshiftExtendedClient(object):
         config = IstioConfigDetails(
                     name=_response.metadata.name,
                     _type=_response.kind,
-                    text=str(_response.metadata) + ' ' + str(_response.spec))
+                    text=json.dumps(_response.to_dict()))
 
         return config
 
@@ -0,0 +1,93 @@
+import requests
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# responses which are worth to retry, usually temporary issues of Kiali or the router
+RETRY_STATUSES = (500, 502, 503, 504)
+# methods which are sent once, a retry could repeat the change on the server
+NON_IDEMPOTENT_METHODS = ('POST', 'PATCH')
+
+
+class PooledSession(object):
+    """HTTP session with a keep-alive connection pool shared by all the requests.
+
+    Retries are applied to connection errors, resets and RETRY_STATUSES
+    with exponential backoff, only for idempotent methods.
+    NON_IDEMPOTENT_METHODS are sent by a separate session without any retries.
+    """
+
+    def __init__(self, auth=None, cookies=None, verify=False, pool_size=10, timeout=60,
+                 retries=3, backoff_factor=0.5):
+        """
+        Args:
+            auth: requests auth object
+            cookies: cookies sent with every request
+            verify: verify TLS certificates
+            pool_size: number of kept alive connections per host
+            timeout: seconds to wait for connect and for the response of each request
+            retries: maximum number of retries of a request
+            backoff_factor: sleep between retries is backoff_factor * 2^(retry - 1) seconds
+        """
+        self.timeout = timeout
+        self.verify = verify
+        self._session = self._create_session(auth, cookies)
+        self._single_session = self._create_session(auth, self._session.cookies)
+        _retry = Retry(total=retries,
+                       connect=retries,
+                       read=retries,
+                       status=retries,
+                       backoff_factor=backoff_factor,
+                       status_forcelist=RETRY_STATUSES,
+                       raise_on_status=False)
+        self._adapter = HTTPAdapter(pool_connections=pool_size,
+                                    pool_maxsize=pool_size,
+                                    max_retries=_retry)
+        self._session.mount('http://', self._adapter)
+        self._session.mount('https://', self._adapter)
+        self._single_adapter = HTTPAdapter(pool_connections=pool_size,
+                                           pool_maxsize=pool_size,
+                                           max_retries=0)
+        self._single_session.mount('http://', self._single_adapter)
+        self._single_session.mount('https://', self._single_adapter)
+
+    def _create_session(self, auth, cookies):
+        _session = requests.Session()
+        _session.auth = auth
+        if cookies is not None:
+            _session.cookies = cookies
+        _session.headers.update({'Content-Type': 'application/json'})
+        return _session
+
+    def request(self, http_method, url, params=None, data=None):
+        if http_method.upper() in NON_IDEMPOTENT_METHODS:
+            _session = self._single_session
+        else:
+            _session = self._session
+        return _session.request(method=http_method,
+                                url=url,
+                                params=params,
+                                data=data,
+                                verify=self.verify,
+                                timeout=self.timeout)
+
+    def stats(self):
+        """Returns counters of the connection pools.
+        Returns:
+            dict with number of 'requests', 'new_connections' and 'reused_connections'
+        """
+        _requests = 0
+        _connections = 0
+        for _adapter in (self._adapter, self._single_adapter):
+            for _key in _adapter.poolmanager.pools.keys():
+                _pool = _adapter.poolmanager.pools.get(_key)
+                if _pool:
+                    _requests += _pool.num_requests
+                    _connections += _pool.num_connections
+        return {'requests': _requests,
+                'new_connections': _connections,
+                'reused_connections': _requests - _connections}
+
+    def close(self):
+        self._session.close()
+        self._single_session.close()
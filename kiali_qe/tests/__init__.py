@@ -1,5 +1,5 @@
+import json
 import random
-import re
 
 from kiali_qe.components import (
     BreadCrumb,
@@ -32,8 +32,13 @@ from kiali_qe.components.enums import (
     RoutingWizardLoadBalancer,
     TrafficType
 )
+from kiali_qe.rest.kiali_api import ISTIO_CONFIG_TYPES
 from kiali_qe.utils import is_equal, is_sublist, word_in_text
+from kiali_qe.utils.conf import env as cfg
+from kiali_qe.utils.config_diff import format_diff, load_yaml, tree_diff
+from kiali_qe.utils.executor import collect
 from kiali_qe.utils.log import logger
+from kiali_qe.utils.reconcile import reconcile
 
 from kiali_qe.pages import (
     ServicesPage,
@@ -50,6 +55,8 @@ class AbstractListPageTest(object):
     SORT_ENUM = None
     SELECT_ITEM = ListViewAbstract.ITEMS + '//a[text()="{}"]'
     SELECT_ITEM_WITH_NAMESPACE = SELECT_ITEM + '/../../td[contains(text(), "{}")]/..//a'
+    # console path of a details page, relative to the console web root
+    DETAILS_PATH = None
 
     def __init__(self, kiali_client, openshift_client, page):
         self.kiali_client = kiali_client
@@ -84,6 +91,42 @@ class AbstractListPageTest(object):
     def get_additional_filters(self, namespaces, current_filters):
         raise NotImplementedError('This method should be implemented on sub class')
 
+    def collect_items(self, ui, rest, oc=None):
+        """
+        Collects items from UI, REST and OC.
+        REST and OC are called in background threads while UI items are harvested.
+
+        Parameters
+        ----------
+        ui, rest, oc : functions without arguments returning list of items
+
+        Returns
+        -------
+        tuple of UI, REST and OC items, OC items are None when oc is not supplied
+        """
+        _functions = {'UI': ui, 'REST': rest}
+        if oc is not None:
+            _functions['OC'] = oc
+        _results, _durations = collect(_functions, foreground='UI')
+        logger.debug('Items collected in [{}]'.format(', '.join(
+            '{}:{:.2f}s'.format(_name, _durations[_name])
+            for _name in ('UI', 'REST', 'OC') if _name in _durations)))
+        return _results['UI'], _results['REST'], _results.get('OC')
+
+    def assert_items_reconciled(self, items_ui, items_rest, items_oc=None):
+        """
+        Asserts UI items are found in REST with advanced check and in OC with basic check.
+        Items are joined by entity key, all the differences are reported at once.
+        """
+        _sources = {'REST': items_rest}
+        if items_oc is not None:
+            _sources['OC'] = items_oc
+        _diff = reconcile(items_ui, _sources, advanced_check=['REST'])
+        assert _diff.is_matching('REST', allow_extra=True), _diff.report('REST')
+        if items_oc is not None:
+            assert _diff.is_matching('OC', allow_extra=True), _diff.report('OC')
+        return _diff
+
     def open(self, name, namespace=None, force_refresh=False):
         # TODO added wait for unstable performance
         wait_to_spinner_disappear(self.browser)
@@ -98,6 +141,46 @@ class AbstractListPageTest(object):
         wait_to_spinner_disappear(self.browser)
         wait_displayed(self.page.content)
 
+    def _prepare_load_details_page(self, name, namespace):
+        raise NotImplementedError('This method should be implemented on sub class')
+
+    def _details_path(self, name, namespace, object_type=None):
+        if self.DETAILS_PATH is None:
+            return None
+        return self.DETAILS_PATH.format(namespace=namespace, name=name)
+
+    def open_details_page(self, name, namespace, force_refresh=False, ui_navigation=None,
+                          object_type=None):
+        """
+        Opens details page of the item.
+
+        Parameters
+        ----------
+        name : item name
+        namespace : item namespace
+        force_refresh : boolean
+            Refresh the page after it is opened via UI.
+            Not needed when it is opened by url, page is loaded fresh.
+        ui_navigation : boolean
+            If True, the list page is loaded, filtered and the item is clicked.
+            Otherwise the details page url is loaded directly.
+            Default is taken from kiali.ui.details_navigation configuration.
+        object_type : string
+            Type of the item, when the details url depends on it, like for istio configs.
+        """
+        if ui_navigation is None:
+            ui_navigation = cfg.kiali.ui.details_navigation == 'ui'
+        _path = None if ui_navigation else self._details_path(name, namespace, object_type)
+        if _path is None:
+            self._prepare_load_details_page(name, namespace)
+            self.open(name, namespace, force_refresh)
+            return
+        self.browser.invalidate_option_snapshots()
+        self.browser.url = 'https://{}{}{}'.format(
+            cfg.kiali.hostname, cfg.kiali.ui.web_root, _path)
+        wait_to_spinner_disappear(self.browser, in_browser=True)
+        wait_displayed(self.page.content)
+
     def is_in_details_page(self, name, namespace):
         breadcrumb = BreadCrumb(self.page)
         if len(breadcrumb.locations) < 3:
@@ -125,23 +208,13 @@ class AbstractListPageTest(object):
             Default False.
             If this value is True, all existing applied namespaces will be removed.
         """
-        _pre_filters = []
         # clear all filters
         if force_clear_all:
             self.page.namespace.clear_all()
             assert len(self.page.namespace.checked_items) == 0
-        else:
-            _pre_filters.extend(self.page.namespace.checked_items)
 
-        # apply namespaces
-        for _filter in namespaces:
-            if _filter not in _pre_filters:
-                self.page.namespace.check(_filter)
-            if _filter in _pre_filters:
-                _pre_filters.remove(_filter)
-        # remove filters not in list
-        for _filter in _pre_filters:
-            self.page.namespace.uncheck(_filter)
+        # check supplied namespaces and uncheck the others in one go
+        self.page.namespace.set_checked(namespaces)
 
         self.assert_applied_namespaces(namespaces)
 
@@ -414,15 +487,15 @@ class OverviewPageTest(AbstractListPageTest):
 
         if force_refresh:
             self.page.page_refresh()
-        # get overviews from ui
-        overviews_ui = self.page.content.all_items
-        # get overviews from rest api
         _ns = self.FILTER_ENUM.NAME.text
         _namespaces = [_f['value'] for _f in filters if _f['name'] == _ns]
         logger.debug('Namespaces:{}'.format(_namespaces))
-        overviews_rest = self.kiali_client.overview_list(
-            namespaces=_namespaces,
-            overview_type=overview_type)
+        # get overviews from ui and rest api
+        overviews_ui, overviews_rest, _ = self.collect_items(
+            ui=lambda: self.page.content.all_items,
+            rest=lambda: self.kiali_client.overview_list(
+                namespaces=_namespaces,
+                overview_type=overview_type))
 
         # compare all results
         logger.debug('Namespaces:{}'.format(_namespaces))
@@ -433,18 +506,14 @@ class OverviewPageTest(AbstractListPageTest):
 
         assert len(overviews_ui) == len(overviews_rest)
 
-        for overview_ui in overviews_ui:
-            found = False
-            for overview_rest in overviews_rest:
-                if overview_ui.is_equal(overview_rest, advanced_check=False):
-                    found = True
-                    break
-            assert found, '{} not found in REST {}'.format(overview_ui, overviews_rest)
+        _diff = reconcile(overviews_ui, {'REST': overviews_rest})
+        assert _diff.is_matching('REST'), _diff.report('REST')
 
 
 class ApplicationsPageTest(AbstractListPageTest):
     FILTER_ENUM = ApplicationsPageFilter
     SORT_ENUM = ApplicationsPageSort
+    DETAILS_PATH = '/namespaces/{namespace}/applications/{name}'
 
     def __init__(self, kiali_client, openshift_client, browser):
         AbstractListPageTest.__init__(
@@ -461,10 +530,10 @@ class ApplicationsPageTest(AbstractListPageTest):
         self.apply_filters(filters=[
             {'name': ApplicationsPageFilter.APP_NAME.text, 'value': name}])
 
-    def load_details_page(self, name, namespace, force_refresh, load_only=False):
+    def load_details_page(self, name, namespace, force_refresh, load_only=False,
+                          ui_navigation=None):
         if not self.is_in_details_page(name, namespace):
-            self._prepare_load_details_page(name, namespace)
-            self.open(name, namespace, force_refresh)
+            self.open_details_page(name, namespace, force_refresh, ui_navigation)
         return self.page.content.get_details(load_only)
 
     def assert_random_details(self, namespaces=[], filters=[], force_refresh=False):
@@ -559,14 +628,13 @@ class ApplicationsPageTest(AbstractListPageTest):
         _application_names = [_f['value'] for _f in filters if _f['name'] == _sn]
 
         logger.debug('Namespaces:{}, Application names:{}'.format(namespaces, _application_names))
-        # get applications from ui
-        applications_ui = self.page.content.all_items
-        # get from REST
-        applications_rest = self.kiali_client.application_list(
-            namespaces=namespaces, application_names=_application_names)
-        # get from OC
-        applications_oc = self.openshift_client.application_list(
-            namespaces=namespaces, application_names=_application_names)
+        # get applications from ui, REST and OC
+        applications_ui, applications_rest, applications_oc = self.collect_items(
+            ui=lambda: self.page.content.all_items,
+            rest=lambda: self.kiali_client.application_list(
+                namespaces=namespaces, application_names=_application_names),
+            oc=lambda: self.openshift_client.application_list(
+                namespaces=namespaces, application_names=_application_names))
 
         # compare all results
         logger.debug('Namespaces:{}, Service names:{}'.format(namespaces, _application_names))
@@ -581,27 +649,13 @@ class ApplicationsPageTest(AbstractListPageTest):
                                                                      applications_ui)
         assert len(applications_rest) <= len(applications_oc)
 
-        for application_ui in applications_ui:
-            found = False
-            for application_rest in applications_rest:
-                if application_ui.is_equal(application_rest, advanced_check=True):
-                    found = True
-                    break
-            if not found:
-                assert found, '{} not found in REST'.format(application_ui)
-            found = False
-            for application_oc in applications_oc:
-                logger.debug('{} {}'.format(application_oc.name, application_oc.namespace))
-                if application_ui.is_equal(application_oc, advanced_check=False):
-                    found = True
-                    break
-            if not found:
-                assert found, '{} not found in OC'.format(application_ui)
+        self.assert_items_reconciled(applications_ui, applications_rest, applications_oc)
 
 
 class WorkloadsPageTest(AbstractListPageTest):
     FILTER_ENUM = WorkloadsPageFilter
     SORT_ENUM = WorkloadsPageSort
+    DETAILS_PATH = '/namespaces/{namespace}/workloads/{name}'
 
     def __init__(self, kiali_client, openshift_client, browser):
         AbstractListPageTest.__init__(
@@ -618,10 +672,10 @@ class WorkloadsPageTest(AbstractListPageTest):
         self.apply_filters(filters=[
             {'name': WorkloadsPageFilter.WORKLOAD_NAME.text, 'value': name}])
 
-    def load_details_page(self, name, namespace, force_refresh, load_only=False):
+    def load_details_page(self, name, namespace, force_refresh, load_only=False,
+                          ui_navigation=None):
         if not self.is_in_details_page(name, namespace):
-            self._prepare_load_details_page(name, namespace)
-            self.open(name, namespace, force_refresh)
+            self.open_details_page(name, namespace, force_refresh, ui_navigation)
         return self.page.content.get_details(load_only)
 
     def assert_random_details(self, namespaces=[], filters=[],
@@ -723,17 +777,16 @@ class WorkloadsPageTest(AbstractListPageTest):
         # apply sorting
         self.sort(sort_options)
 
-        # get workloads from ui
-        workloads_ui = self.page.content.all_items
-        # get workloads from rest api
         _sn = self.FILTER_ENUM.WORKLOAD_NAME.text
         _workload_names = [_f['value'] for _f in filters if _f['name'] == _sn]
         logger.debug('Namespaces:{}, Workload names:{}'.format(namespaces, _workload_names))
-        workloads_rest = self.kiali_client.workload_list(
-            namespaces=namespaces, workload_names=_workload_names)
-        # get workloads from OC client
-        workloads_oc = self.openshift_client.workload_list(
-            namespaces=namespaces, workload_names=_workload_names)
+        # get workloads from ui, rest api and OC client
+        workloads_ui, workloads_rest, workloads_oc = self.collect_items(
+            ui=lambda: self.page.content.all_items,
+            rest=lambda: self.kiali_client.workload_list(
+                namespaces=namespaces, workload_names=_workload_names),
+            oc=lambda: self.openshift_client.workload_list(
+                namespaces=namespaces, workload_names=_workload_names))
 
         # compare all results
         logger.debug('Namespaces:{}, Service names:{}'.format(namespaces, _workload_names))
@@ -748,26 +801,13 @@ class WorkloadsPageTest(AbstractListPageTest):
         # TODO when workloads are filtered put == here
         assert len(workloads_rest) <= len(workloads_oc)
 
-        for workload_ui in workloads_ui:
-            found = False
-            for workload_rest in workloads_rest:
-                if workload_ui.is_equal(workload_rest, advanced_check=True):
-                    found = True
-                    break
-            if not found:
-                assert found, '{} not found in REST'.format(workload_ui)
-            found = False
-            for workload_oc in workloads_oc:
-                if workload_ui.is_equal(workload_oc, advanced_check=False):
-                    found = True
-                    break
-            if not found:
-                assert found, '{} not found in OC'.format(workload_ui)
+        self.assert_items_reconciled(workloads_ui, workloads_rest, workloads_oc)
 
 
 class ServicesPageTest(AbstractListPageTest):
     FILTER_ENUM = ServicesPageFilter
     SORT_ENUM = ServicesPageSort
+    DETAILS_PATH = '/namespaces/{namespace}/services/{name}'
 
     def __init__(self, kiali_client, openshift_client, browser):
         AbstractListPageTest.__init__(
@@ -784,10 +824,10 @@ class ServicesPageTest(AbstractListPageTest):
         self.apply_filters(filters=[
             {'name': ServicesPageFilter.SERVICE_NAME.text, 'value': name}])
 
-    def load_details_page(self, name, namespace, force_refresh, load_only=False):
+    def load_details_page(self, name, namespace, force_refresh, load_only=False,
+                          ui_navigation=None):
         if not self.is_in_details_page(name, namespace):
-            self._prepare_load_details_page(name, namespace)
-            self.open(name, namespace, force_refresh)
+            self.open_details_page(name, namespace, force_refresh, ui_navigation)
         return self.page.content.get_details(load_only)
 
     def assert_random_details(self, namespaces=[], filters=[], force_refresh=False):
@@ -909,17 +949,16 @@ class ServicesPageTest(AbstractListPageTest):
         # apply sorting
         self.sort(sort_options)
 
-        # get services from ui
-        services_ui = self.page.content.all_items
-        # get services from rest api
         _sn = self.FILTER_ENUM.SERVICE_NAME.text
         _service_names = [_f['value'] for _f in filters if _f['name'] == _sn]
         logger.debug('Namespaces:{}, Service names:{}'.format(namespaces, _service_names))
-        services_rest = self.kiali_client.service_list(
-            namespaces=namespaces, service_names=_service_names)
-        # get services from OC client
-        services_oc = self.openshift_client.service_list(
-            namespaces=namespaces, service_names=_service_names)
+        # get services from ui, rest api and OC client
+        services_ui, services_rest, services_oc = self.collect_items(
+            ui=lambda: self.page.content.all_items,
+            rest=lambda: self.kiali_client.service_list(
+                namespaces=namespaces, service_names=_service_names),
+            oc=lambda: self.openshift_client.service_list(
+                namespaces=namespaces, service_names=_service_names))
 
         # compare all results
         logger.debug('Namespaces:{}, Service names:{}'.format(namespaces, _service_names))
@@ -933,21 +972,7 @@ class ServicesPageTest(AbstractListPageTest):
             "UI {} and REST {} services number not equal".format(services_ui, services_rest)
         assert len(services_rest) <= len(services_oc)
 
-        for service_ui in services_ui:
-            found = False
-            for service_rest in services_rest:
-                if service_ui.is_equal(service_rest, advanced_check=True):
-                    found = True
-                    break
-            if not found:
-                assert found, '{} not found in REST'.format(service_ui)
-            found = False
-            for service_oc in services_oc:
-                if service_ui.is_equal(service_oc, advanced_check=False):
-                    found = True
-                    break
-            if not found:
-                assert found, '{} not found in OC'.format(service_ui)
+        self.assert_items_reconciled(services_ui, services_rest, services_oc)
 
     def get_additional_filters(self, namespaces, current_filters):
         logger.debug('Current filters:{}'.format(current_filters))
@@ -973,8 +998,7 @@ class ServicesPageTest(AbstractListPageTest):
                             gateway=True, include_mesh_gateway=True):
         logger.debug('Routing Wizard {} for Service: {}, {}'.format(routing_type, name, namespace))
         # load service details page
-        self._prepare_load_details_page(name, namespace)
-        self.open(name, namespace)
+        self.open_details_page(name, namespace)
         self.page.actions.delete_all_routing()
         if routing_type == RoutingWizardType.CREATE_WEIGHTED_ROUTING:
             assert self.page.actions.create_weighted_routing(
@@ -1003,6 +1027,8 @@ class ServicesPageTest(AbstractListPageTest):
             assert self.page.actions.is_create_matching_disabled()
             assert self.page.actions.is_create_weighted_disabled()
             assert self.page.actions.is_update_suspended_enabled()
+        # routing was changed by UI, drop cached responses of kiali client
+        self.kiali_client.invalidate_cache(namespace)
         # get service details from rest
         service_details_rest = self.kiali_client.service_details(
             namespace=namespace,
@@ -1039,8 +1065,7 @@ class ServicesPageTest(AbstractListPageTest):
                                                                            name,
                                                                            namespace))
         # load service details page
-        self._prepare_load_details_page(name, namespace)
-        self.open(name, namespace)
+        self.open_details_page(name, namespace)
         if routing_type == RoutingWizardType.UPDATE_WEIGHTED_ROUTING:
             assert self.page.actions.update_weighted_routing(
                 tls=tls, load_balancer=load_balancer,
@@ -1068,6 +1093,8 @@ class ServicesPageTest(AbstractListPageTest):
             assert self.page.actions.is_create_matching_disabled()
             assert self.page.actions.is_create_weighted_disabled()
             assert self.page.actions.is_update_suspended_enabled()
+        # routing was changed by UI, drop cached responses of kiali client
+        self.kiali_client.invalidate_cache(namespace)
         # get service details from rest
         service_details_rest = self.kiali_client.service_details(
             namespace=namespace,
@@ -1099,13 +1126,14 @@ class ServicesPageTest(AbstractListPageTest):
     def test_routing_delete(self, name, namespace):
         logger.debug('Routing Delete for Service: {}, {}'.format(name, namespace))
         # load service details page
-        self._prepare_load_details_page(name, namespace)
-        self.open(name, namespace)
+        self.open_details_page(name, namespace)
         assert self.page.actions.delete_all_routing()
         assert self.page.actions.is_delete_disabled()
         assert self.page.actions.is_create_weighted_enabled()
         assert self.page.actions.is_create_matching_enabled()
         assert self.page.actions.is_suspend_enabled()
+        # routing was changed by UI, drop cached responses of kiali client
+        self.kiali_client.invalidate_cache(namespace)
         # get service details from rest
         service_details_rest = self.kiali_client.service_details(
             namespace=namespace,
@@ -1117,6 +1145,7 @@ class ServicesPageTest(AbstractListPageTest):
 class IstioConfigPageTest(AbstractListPageTest):
     FILTER_ENUM = IstioConfigPageFilter
     SORT_ENUM = IstioConfigPageSort
+    DETAILS_PATH = '/namespaces/{namespace}/istio/{config_type}/{name}'
 
     def __init__(self, kiali_client, openshift_client, browser):
         AbstractListPageTest.__init__(
@@ -1133,10 +1162,18 @@ class IstioConfigPageTest(AbstractListPageTest):
         self.apply_filters(filters=[
             {'name': IstioConfigPageFilter.ISTIO_NAME.text, 'value': name}])
 
-    def load_details_page(self, name, namespace, force_refresh, load_only=False):
+    def _details_path(self, name, namespace, object_type=None):
+        # configs of different types can have the same name, type is part of the url
+        _config_type = ISTIO_CONFIG_TYPES.get(object_type)
+        if _config_type is None:
+            # type is not known or it is a rule, which is not linked by type, open via UI
+            return None
+        return self.DETAILS_PATH.format(namespace=namespace, config_type=_config_type, name=name)
+
+    def load_details_page(self, name, namespace, force_refresh, load_only=False,
+                          ui_navigation=None, object_type=None):
         if not self.is_in_details_page(name, namespace):
-            self._prepare_load_details_page(name, namespace)
-            self.open(name, namespace, force_refresh)
+            self.open_details_page(name, namespace, force_refresh, ui_navigation, object_type)
         return self.page.content.get_details(name, load_only)
 
     def assert_all_items(self, namespaces=[], filters=[], sort_options=[], force_clear_all=True):
@@ -1154,39 +1191,22 @@ class IstioConfigPageTest(AbstractListPageTest):
         _sn = self.FILTER_ENUM.ISTIO_NAME.text
         _istio_names = [_f['value'] for _f in filters if _f['name'] == _sn]
 
-        # get rules from ui
-        config_list_ui = self.page.content.all_items
+        # get configs from ui, rest api and OC api
+        config_list_ui, config_list_rest, config_list_oc = self.collect_items(
+            ui=lambda: self.page.content.all_items,
+            rest=lambda: self.kiali_client.istio_config_list(
+                namespaces=namespaces, config_names=_istio_names),
+            oc=lambda: self.openshift_client.istio_config_list(
+                namespaces=namespaces, config_names=_istio_names))
         logger.debug('Istio config list UI:{}]'.format(config_list_ui))
-
-        # get rules from rest api
-        config_list_rest = self.kiali_client.istio_config_list(
-            namespaces=namespaces, config_names=_istio_names)
         logger.debug('Istio config list REST:{}]'.format(config_list_rest))
-
-        # get configs from OC api
-        config_list_oc = self.openshift_client.istio_config_list(
-            namespaces=namespaces, config_names=_istio_names)
         logger.debug('Istio config list OC API:{}]'.format(config_list_oc))
 
         # compare 3 way results
         assert len(config_list_ui) == len(config_list_rest), \
             "UI {} and REST {} config number not equal".format(config_list_ui, config_list_rest)
         assert len(config_list_ui) == len(config_list_oc)
-        for config_ui in config_list_ui:
-            found = False
-            for config_rest in config_list_rest:
-                if config_ui.is_equal(config_rest, advanced_check=True):
-                    found = True
-                    break
-            if not found:
-                assert found, '{} not found in REST'.format(config_ui)
-            found = False
-            for config_oc in config_list_oc:
-                if config_ui.is_equal(config_oc, advanced_check=False):
-                    found = True
-                    break
-            if not found:
-                assert found, '{} not found in OC'.format(config_ui)
+        self.assert_items_reconciled(config_list_ui, config_list_rest, config_list_oc)
 
     def assert_random_details(self, namespaces=[], filters=[]):
         # get istio config from rest api
@@ -1210,7 +1230,8 @@ class IstioConfigPageTest(AbstractListPageTest):
         logger.debug('Details: {}, {}'.format(name, namespace))
 
         # load config details page
-        config_details_ui = self.load_details_page(name, namespace, force_refresh=False)
+        config_details_ui = self.load_details_page(name, namespace, force_refresh=False,
+                                                   object_type=object_type)
         assert config_details_ui
         assert name == config_details_ui.name
         assert config_details_ui.text
@@ -1239,84 +1260,27 @@ class IstioConfigPageTest(AbstractListPageTest):
             advanced_check=True if
             config_details_rest.validation != IstioConfigValidation.NA
             else False)
-        # find key: value pairs from UI in a REST
-        for config_ui in re.split(' ',
-                                  str(config_details_ui.text).
-                                  replace('\'', '').
-                                  replace('~', 'null').
-                                  replace('selfLink: >- ', 'selfLink: ').
-                                  replace(': > ', ': ').
-                                  replace('{', '').
-                                  replace('}', '').
-                                  replace('"', '').
-                                  replace(',', '').
-                                  replace('[', '').
-                                  replace(']', '').
-                                  replace('\\', '')):
-            if config_ui.endswith(':'):
-                ui_key = config_ui
-            elif config_ui.strip() != '-':  # skip this line, it was for formatting
-                # the previous one was the key of this value
-                found = False
-                # make the REST result into the same format as shown in UI
-                # to compare only the values
-                for config_rest in str(config_details_rest.text).\
-                        replace('\\n', '').\
-                        replace('\\', '').\
-                        replace('{', '').\
-                        replace('}', '').\
-                        replace('"', '').\
-                        replace(',', '').\
-                        replace('[', '').\
-                        replace(']', '').\
-                        split(' '):
-                    if config_rest.endswith(':'):
-                        rest_key = config_rest
-                    else:
-                        # the previous one was the key of this value
-                        if ui_key == rest_key and config_ui == config_rest:
-                            found = True
-                            break
-                if not found:
-                    assert found, '{} {} not found in REST'.format(ui_key, config_ui)
-                found = False
-                # make the OC result into the same format as shown in UI
-                # to compare only the values
-                config_oc_list = str(config_details_oc.text).\
-                    replace('\n', '').\
-                    replace('\'', '').\
-                    replace("\\n", '').\
-                    replace(' - ', '').\
-                    replace('{', '').\
-                    replace('}', '').\
-                    replace('"', '').\
-                    replace(',', '').\
-                    replace('[', '').\
-                    replace(']', '').\
-                    split(' ')
-                config_oc_list.append('kind:')
-                config_oc_list.append(config_details_oc._type)
-                if ui_key == 'apiVersion:':
-                    continue
-                for config_oc in config_oc_list:
-                    if config_oc.endswith(':'):
-                        oc_key = config_oc
-                    else:
-                        # the previous one was the key of this value
-                        if (ui_key == oc_key and config_ui == config_oc) or config_ui == 'null':
-                            found = True
-                            break
-                if not found:
-                    assert found, '{} {} not found in OC'.format(ui_key, config_ui)
-
-    def delete_istio_config(self, name, namespace=None):
-        self.load_details_page(name, namespace, force_refresh=False, load_only=True)
+        # compare UI YAML with REST and OC objects by JSON paths
+        _tree_ui = load_yaml(config_details_ui.text)
+        assert _tree_ui, 'UI config is empty'
+        _diff_rest = tree_diff(_tree_ui, json.loads(config_details_rest.text))
+        assert not _diff_rest, 'UI config differs from REST:\n{}'.format(format_diff(_diff_rest))
+        # apiVersion is served in the preferred version by OC
+        _diff_oc = tree_diff(_tree_ui, json.loads(config_details_oc.text),
+                             ignore_paths=('$.apiVersion',), skip_null=True)
+        assert not _diff_oc, 'UI config differs from OC:\n{}'.format(format_diff(_diff_oc))
+
+    def delete_istio_config(self, name, namespace=None, object_type=None):
+        self.load_details_page(name, namespace, force_refresh=False, load_only=True,
+                               object_type=object_type)
         self.page.actions.select('Delete')
         wait_displayed(self.page.content)
         self.browser.click(self.browser.element(
             parent=ListViewAbstract.DIALOG_ROOT,
             locator=('.//button[text()="Delete"]')))
         wait_displayed(self.page.content)
+        # config was deleted by UI, drop cached responses of kiali client
+        self.kiali_client.invalidate_cache(namespace)
 
     def click_on_gateway(self, name, namespace):
         self.browser.click(self.browser.element(locator=self.page.content.CONFIG_TAB_OVERVIEW,
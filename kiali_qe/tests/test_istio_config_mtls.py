@@ -378,6 +378,8 @@ def _test_istio_objects(kiali_client, openshift_client, browser, scenario, names
 
     try:
         _istio_config_create(yaml_file, namespace=namespace)
+        # scenario is applied by oc, it can change objects of several namespaces
+        kiali_client.invalidate_cache()
 
         for _object in config_validation_objects:
             _test_validation_errors(kiali_client,
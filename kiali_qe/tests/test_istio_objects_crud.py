@@ -97,13 +97,13 @@ def test_destination_rule_broken(kiali_client, openshift_client, browser):
 def test_virtual_service(kiali_client, openshift_client, browser):
     gateway = get_yaml(istio_objects_path.strpath, GATEWAY)
     gateway_dict = get_dict(istio_objects_path.strpath, GATEWAY)
-    _istio_config_create(openshift_client, gateway_dict, gateway,
+    _istio_config_create(kiali_client, openshift_client, gateway_dict, gateway,
                          'Gateway',
                          'networking.istio.io/v1alpha3',
                          namespace=BOOKINFO_1)
     virtual_service = get_yaml(istio_objects_path.strpath, VIRTUAL_SERVICE)
     virtual_service_dict = get_dict(istio_objects_path.strpath, VIRTUAL_SERVICE)
-    _create_dest_rule_vs(openshift_client, DEST_RULE_VS_REVIEWS)
+    _create_dest_rule_vs(kiali_client, openshift_client, DEST_RULE_VS_REVIEWS)
 
     _istio_config_test(kiali_client, openshift_client, browser,
                        virtual_service_dict,
@@ -127,8 +127,8 @@ def test_virtual_service(kiali_client, openshift_client, browser):
                           kind='Gateway',
                           vs_name=virtual_service_dict.metadata.name,
                           namespace=BOOKINFO_1)
-    _delete_dest_rule_vs(openshift_client, DEST_RULE_VS_REVIEWS)
-    _delete_gateway_vs(openshift_client, GATEWAY)
+    _delete_dest_rule_vs(kiali_client, openshift_client, DEST_RULE_VS_REVIEWS)
+    _delete_gateway_vs(kiali_client, openshift_client, GATEWAY)
 
 
 @pytest.mark.p_crud_resource
@@ -136,7 +136,7 @@ def test_virtual_service(kiali_client, openshift_client, browser):
 def test_virtual_service_broken(kiali_client, openshift_client, browser):
     virtual_service_broken = get_yaml(istio_objects_path.strpath, VIRTUAL_SERVICE_BROKEN)
     virtual_service_broken_dict = get_dict(istio_objects_path.strpath, VIRTUAL_SERVICE_BROKEN)
-    _create_dest_rule_vs(openshift_client, DEST_RULE_VS_REVIEWS)
+    _create_dest_rule_vs(kiali_client, openshift_client, DEST_RULE_VS_REVIEWS)
 
     _istio_config_test(kiali_client, openshift_client, browser,
                        virtual_service_broken_dict,
@@ -158,7 +158,7 @@ def test_virtual_service_broken(kiali_client, openshift_client, browser):
                            "valid service (host not found)",
                             'Subset not found'],
                        check_service_details=True)
-    _delete_dest_rule_vs(openshift_client, DEST_RULE_VS_REVIEWS)
+    _delete_dest_rule_vs(kiali_client, openshift_client, DEST_RULE_VS_REVIEWS)
 
 
 @pytest.mark.p_crud_resource
@@ -169,7 +169,7 @@ def test_virtual_service_broken_weight(kiali_client, openshift_client, browser):
     virtual_service_broken_dict = get_dict(istio_objects_path.strpath,
                                            VIRTUAL_SERVICE_BROKEN_WEIGHT)
     try:
-        _create_dest_rule_vs(openshift_client, DEST_RULE_VS_REVIEWS)
+        _create_dest_rule_vs(kiali_client, openshift_client, DEST_RULE_VS_REVIEWS)
 
         _istio_config_test(kiali_client, openshift_client, browser,
                            virtual_service_broken_dict,
@@ -188,7 +188,7 @@ def test_virtual_service_broken_weight(kiali_client, openshift_client, browser):
                            service_name=REVIEWS,
                            error_messages=['Weight sum should be 100'],
                            check_service_details=False)
-        _delete_dest_rule_vs(openshift_client, DEST_RULE_VS_REVIEWS)
+        _delete_dest_rule_vs(kiali_client, openshift_client, DEST_RULE_VS_REVIEWS)
     except InternalServerError:
         pass
 
@@ -201,7 +201,7 @@ def test_virtual_service_broken_weight_text(kiali_client, openshift_client, brow
     virtual_service_broken_dict = get_dict(istio_objects_path.strpath,
                                            VIRTUAL_SERVICE_BROKEN_WEIGHT_TEXT)
     try:
-        _create_dest_rule_vs(openshift_client, DEST_RULE_VS_RATINGS)
+        _create_dest_rule_vs(kiali_client, openshift_client, DEST_RULE_VS_RATINGS)
 
         _istio_config_test(kiali_client, openshift_client, browser,
                            virtual_service_broken_dict,
@@ -221,7 +221,7 @@ def test_virtual_service_broken_weight_text(kiali_client, openshift_client, brow
                            error_messages=['Weight must be a number',
                                            'Weight sum should be 100'],
                            check_service_details=False)
-        _delete_dest_rule_vs(openshift_client, DEST_RULE_VS_RATINGS)
+        _delete_dest_rule_vs(kiali_client, openshift_client, DEST_RULE_VS_RATINGS)
     except InternalServerError:
         pass
 
@@ -410,7 +410,7 @@ def test_service_role_broken(kiali_client, openshift_client, browser):
 def test_service_role_binding(kiali_client, openshift_client, browser):
     _role_yaml = get_yaml(istio_objects_path.strpath, SERVICE_ROLE)
     _role_dict = get_dict(istio_objects_path.strpath, SERVICE_ROLE)
-    _istio_config_create(openshift_client, _role_dict, _role_yaml,
+    _istio_config_create(kiali_client, openshift_client, _role_dict, _role_yaml,
                          namespace='istio-system',
                          kind='ServiceRole',
                          api_version='rbac.istio.io/v1alpha1')
@@ -433,7 +433,7 @@ def test_service_role_binding(kiali_client, openshift_client, browser):
                            service_name=DETAILS,
                            check_service_details=False)
     finally:
-        _istio_config_delete(openshift_client, _role_dict,
+        _istio_config_delete(kiali_client, openshift_client, _role_dict,
                              namespace='istio-system',
                              kind='ServiceRole',
                              api_version='rbac.istio.io/v1alpha1')
@@ -444,7 +444,7 @@ def test_service_role_binding(kiali_client, openshift_client, browser):
 def test_service_role_binding_broken(kiali_client, openshift_client, browser):
     _role_yaml = get_yaml(istio_objects_path.strpath, SERVICE_ROLE)
     _role_dict = get_dict(istio_objects_path.strpath, SERVICE_ROLE)
-    _istio_config_create(openshift_client, _role_dict, _role_yaml,
+    _istio_config_create(kiali_client, openshift_client, _role_dict, _role_yaml,
                          namespace='istio-system',
                          kind='ServiceRole',
                          api_version='rbac.istio.io/v1alpha1')
@@ -468,66 +468,93 @@ def test_service_role_binding_broken(kiali_client, openshift_client, browser):
                            error_messages=['ServiceRole does not exists in this namespace'],
                            check_service_details=False)
     finally:
-        _istio_config_delete(openshift_client, _role_dict,
+        _istio_config_delete(kiali_client, openshift_client, _role_dict,
                              namespace='istio-system',
                              kind='ServiceRole',
                              api_version='rbac.istio.io/v1alpha1')
 
 
-def _istio_config_create(openshift_client, config_dict, config_yaml, kind, api_version,
-                         namespace=BOOKINFO_1):
+def _istio_config_create(kiali_client, openshift_client, config_dict, config_yaml, kind,
+                         api_version, namespace=BOOKINFO_1):
     openshift_client.delete_istio_config(name=config_dict.metadata.name,
                                          namespace=namespace,
                                          kind=kind,
                                          api_version=api_version)
+    _wait_for_istio_config(kiali_client, openshift_client, config_dict, kind, api_version,
+                           namespace, exists=False)
 
     openshift_client.create_istio_config(body=config_yaml,
                                          namespace=namespace,
                                          kind=kind,
                                          api_version=api_version)
+    _wait_for_istio_config(kiali_client, openshift_client, config_dict, kind, api_version,
+                           namespace, exists=True)
 
 
-def _istio_config_delete(openshift_client, config_dict, kind, api_version, namespace=BOOKINFO_1):
+def _istio_config_delete(kiali_client, openshift_client, config_dict, kind, api_version,
+                         namespace=BOOKINFO_1):
     openshift_client.delete_istio_config(name=config_dict.metadata.name,
                                          namespace=namespace,
                                          kind=kind,
                                          api_version=api_version)
+    _wait_for_istio_config(kiali_client, openshift_client, config_dict, kind, api_version,
+                           namespace, exists=False)
+
+
+def _wait_for_istio_config(kiali_client, openshift_client, config_dict, kind, api_version,
+                           namespace, exists):
+    # config was changed outside of kiali client, drop its cached responses
+    kiali_client.invalidate_cache(namespace)
+    # with informers, OC lists are answered from the watched store, wait until it is updated
+    # kiali client is used instead of OC client when kiali.skip_oc is set, it can not wait
+    if not hasattr(openshift_client, 'wait_for_istio_config'):
+        return
+    assert openshift_client.wait_for_istio_config(name=config_dict.metadata.name,
+                                                  namespace=namespace,
+                                                  kind=kind,
+                                                  api_version=api_version,
+                                                  exists=exists), \
+        '{} {} was not {}'.format(kind, config_dict.metadata.name,
+                                  'created' if exists else 'deleted')
 
 
 def _ui_istio_config_delete(tests, config_dict, namespace=BOOKINFO_1):
     tests.delete_istio_config(name=config_dict.metadata.name,
-                              namespace=namespace)
+                              namespace=namespace,
+                              object_type=config_dict.kind)
 
 
-def _create_dest_rule_vs(openshift_client, destination_rule_conf, namespace=BOOKINFO_1):
+def _create_dest_rule_vs(kiali_client, openshift_client, destination_rule_conf,
+                         namespace=BOOKINFO_1):
     destination_rule = get_yaml(istio_objects_path.strpath, destination_rule_conf)
     destination_rule_dict = get_dict(istio_objects_path.strpath, destination_rule_conf)
-    _istio_config_create(openshift_client, destination_rule_dict, destination_rule,
+    _istio_config_create(kiali_client, openshift_client, destination_rule_dict, destination_rule,
                          'DestinationRule',
                          'networking.istio.io/v1alpha3',
                          namespace)
 
 
-def _delete_dest_rule_vs(openshift_client, destination_rule_conf, namespace=BOOKINFO_1):
+def _delete_dest_rule_vs(kiali_client, openshift_client, destination_rule_conf,
+                         namespace=BOOKINFO_1):
     destination_rule_dict = get_dict(istio_objects_path.strpath, destination_rule_conf)
-    _istio_config_delete(openshift_client, destination_rule_dict,
+    _istio_config_delete(kiali_client, openshift_client, destination_rule_dict,
                          'DestinationRule',
                          'networking.istio.io/v1alpha3',
                          namespace)
 
 
-def _create_gateway_vs(openshift_client, gateway_conf, namespace=BOOKINFO_1):
+def _create_gateway_vs(kiali_client, openshift_client, gateway_conf, namespace=BOOKINFO_1):
     gateway = get_yaml(istio_objects_path.strpath, gateway_conf)
     gateway_dict = get_dict(istio_objects_path.strpath, gateway_conf)
-    _istio_config_create(openshift_client, gateway_dict, gateway,
+    _istio_config_create(kiali_client, openshift_client, gateway_dict, gateway,
                          'Gateway',
                          'networking.istio.io/v1alpha3',
                          namespace)
 
 
-def _delete_gateway_vs(openshift_client, gateway_conf, namespace=BOOKINFO_1):
+def _delete_gateway_vs(kiali_client, openshift_client, gateway_conf, namespace=BOOKINFO_1):
     gateway_dict = get_dict(istio_objects_path.strpath, gateway_conf)
-    _istio_config_delete(openshift_client, gateway_dict,
+    _istio_config_delete(kiali_client, openshift_client, gateway_dict,
                          'Gateway',
                          'networking.istio.io/v1alpha3',
                          namespace)
@@ -546,7 +573,7 @@ def _istio_config_test(kiali_client, openshift_client, browser, config_dict,
 
     try:
         _istio_config_create(
-            openshift_client, config_dict, config_yaml, kind, api_version, namespace)
+            kiali_client, openshift_client, config_dict, config_yaml, kind, api_version, namespace)
 
         # sleep 1 minute to wait for metrics to be collected before checking
         time.sleep(1)
@@ -579,7 +606,8 @@ def _istio_config_test(kiali_client, openshift_client, browser, config_dict,
             tests.assert_all_items(namespaces=[namespace], filters=filters)
     finally:
         if delete_istio_config:
-            _istio_config_delete(openshift_client, config_dict, kind, api_version, namespace)
+            _istio_config_delete(kiali_client, openshift_client, config_dict, kind, api_version,
+                                 namespace)
 
 
 def _istio_config_details_test(kiali_client, openshift_client, browser, config_dict,
@@ -608,7 +636,8 @@ def _vs_gateway_link_test(kiali_client, openshift_client, browser, config_dict,
     tests = IstioConfigPageTest(
         kiali_client=kiali_client, openshift_client=openshift_client, browser=browser)
 
-    tests.load_details_page(vs_name, namespace, force_refresh=False, load_only=True)
+    tests.load_details_page(vs_name, namespace, force_refresh=False, load_only=True,
+                            object_type=IstioConfigObjectType.VIRTUAL_SERVICE.text)
 
     tests.click_on_gateway(config_dict.metadata.name, namespace)
 
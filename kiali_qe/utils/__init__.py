@@ -1,4 +1,5 @@
 import yaml
+from collections import OrderedDict
 from dotmap import DotMap
 import operator
 import os
@@ -33,28 +34,15 @@ def get_yaml_path(path, yaml_file):
 
 
 def is_equal(object_a, object_b):
+    """ Compares lists as multisets, order does not matter, number of occurrences does.
+    Scalars and dicts are compared by value, entities by their is_equal.
+    """
     if isinstance(object_a, list):
-        if len(object_a) == len(object_b):
-            for item_a in object_a:
-                if isinstance(item_a, str) or isinstance(item_a, float)\
-                 or isinstance(item_a, int) or isinstance(item_a, bytes):
-                    if item_a not in object_b:
-                        return False
-                elif isinstance(item_a, dict):
-                    _is_in = False
-                    for item_b in object_b:
-                        if _cmp_dict(item_a, item_b):
-                            _is_in = True
-                            break
-                    if not _is_in:
-                        return False
-
-                else:
-                    if not item_a.is_in(object_b):
-                        return False
-            return True
-        else:
+        object_b = list(object_b)
+        if len(object_a) != len(object_b):
             return False
+        _missing, _extra = list_diff(object_a, object_b)
+        return len(_missing) == 0 and len(_extra) == 0
     elif isinstance(object_a, dict):
         return _cmp_dict(object_a, object_b)
 
@@ -64,7 +52,80 @@ def _cmp_dict(a, b):
 
 
 def is_sublist(list_a, list_b):
-    return set(list_a).issubset(set(list_b))
+    """ True when every item of list_a is in list_b, number of occurrences does not matter """
+    _index = _index_items(list_b)
+    for _item in list_a:
+        if _find(_index.get(_item_key(_item)), _item) is None:
+            return False
+    return True
+
+
+def list_diff(list_a, list_b):
+    """ Returns minimal difference of two lists compared as multisets.
+    Items are indexed by key, so it runs in linear time for scalars and dicts,
+    entities are indexed by name and paired by their is_equal.
+    Returns:
+        tuple of lists, items of list_a not in list_b and items of list_b not in list_a
+    """
+    _index = _index_items(list_b)
+    _missing = []
+    for _item in list_a:
+        _candidates = _index.get(_item_key(_item))
+        _position = _find(_candidates, _item)
+        if _position is None:
+            _missing.append(_item)
+        else:
+            _candidates.pop(_position)
+    _extra = [_item for _candidates in _index.values() for _item in _candidates]
+    return _missing, _extra
+
+
+def _is_entity(item):
+    return hasattr(item, 'is_equal')
+
+
+def _freeze(value):
+    """ Returns hashable value equal for the equal values """
+    if isinstance(value, dict):
+        return frozenset((_key, _freeze(_value)) for _key, _value in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(_value) for _value in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(_value) for _value in value)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+def _item_key(item):
+    if _is_entity(item):
+        if getattr(item, 'KEY_FIELDS', None):
+            return ('entity', item.key)
+        # other entities are not hashed, their __hash__ does not always follow is_equal
+        return ('entity', getattr(item, 'name', None))
+    return ('value', _freeze(item))
+
+
+def _index_items(items):
+    _index = OrderedDict()
+    for _item in items:
+        _index.setdefault(_item_key(_item), []).append(_item)
+    return _index
+
+
+def _find(candidates, item):
+    """ Returns position of an item equal to item in its index bucket, None when not found """
+    if not candidates:
+        return None
+    if not _is_entity(item):
+        # all the values of the bucket are equal
+        return len(candidates) - 1
+    for _position, _candidate in enumerate(candidates):
+        if item.is_equal(_candidate):
+            return _position
+    return None
 
 
 def get_validation(_valid, _not_valid, _warning):
@@ -10,6 +10,7 @@ _env_override_list = {
         'kiali.password': 'KIALI_PASSWORD',
         'kiali.auth_type': 'KIALI_AUTH_TYPE',
         'kiali.token': 'KIALI_TOKEN',
+        'selenium.mode': 'SELENIUM_MODE',
         'selenium.web_driver': 'SELENIUM_WEB_DRIVER',
         'selenium.capabilities.platform': 'SELENIUM_PLATFORM',
         'selenium.capabilities.browser': 'SELENIUM_BROWESR',
@@ -0,0 +1,81 @@
+""" Comparison of configuration objects, like istio configs, parsed into trees """
+import re
+
+from collections import OrderedDict
+
+import yaml
+
+# value of the paths which are not in the compared tree
+MISSING = '<missing>'
+
+
+class _NoTimestampLoader(yaml.SafeLoader):
+    """ Keeps timestamps as strings, the same as they are in JSON """
+
+
+_NoTimestampLoader.yaml_implicit_resolvers = dict(
+    (_first, [(_tag, _regexp) for _tag, _regexp in _resolvers
+              if _tag != 'tag:yaml.org,2002:timestamp'])
+    for _first, _resolvers in yaml.SafeLoader.yaml_implicit_resolvers.items())
+
+
+def load_yaml(text):
+    """ Parses whole YAML document, the one of the UI editor for example.
+    Raises yaml.YAMLError when it is not valid, it is not parsed partially,
+    as a cut document would be compared only in its beginning.
+    """
+    return yaml.load(text, Loader=_NoTimestampLoader)
+
+
+def _key_path(path, key):
+    if re.match('^[A-Za-z_][A-Za-z0-9_-]*$', str(key)):
+        return '{}.{}'.format(path, key)
+    return '{}[\'{}\']'.format(path, key)
+
+
+def flatten(tree, path='$', ignore_paths=()):
+    """ Returns OrderedDict of JSON path to leaf value, empty dicts and lists are leaves.
+    Subtrees of the JSON paths in ignore_paths, like '$.apiVersion', are left out.
+    """
+    _leaves = OrderedDict()
+    _stack = [(path, tree)]
+    while _stack:
+        _path, _value = _stack.pop()
+        if isinstance(_value, dict) and _value:
+            _stack.extend(reversed([(_key_path(_path, _key), _child)
+                                    for _key, _child in _value.items()
+                                    if _key_path(_path, _key) not in ignore_paths]))
+        elif isinstance(_value, list) and _value:
+            _stack.extend(reversed([('{}[{}]'.format(_path, _index), _child)
+                                    for _index, _child in enumerate(_value)]))
+        else:
+            _leaves[_path] = _value
+    return _leaves
+
+
+def tree_diff(tree_a, tree_b, ignore_paths=(), skip_null=False):
+    """ Returns leaves of tree_a which are missing in tree_b or have a different value.
+    Both trees are flattened once, so it runs in linear time.
+    Args:
+        tree_a: parsed object, dicts and lists
+        tree_b: parsed object to look the leaves of tree_a up in
+        ignore_paths: JSON paths of tree_a whose subtrees are not compared
+        skip_null: do not compare None values of tree_a
+    Returns:
+        list of (JSON path, value in tree_a, value in tree_b or MISSING)
+    """
+    _leaves_b = flatten(tree_b)
+    _diff = []
+    for _path, _value in flatten(tree_a, ignore_paths=ignore_paths).items():
+        if skip_null and _value is None:
+            continue
+        if _path not in _leaves_b:
+            _diff.append((_path, _value, MISSING))
+        elif _value != _leaves_b[_path]:
+            _diff.append((_path, _value, _leaves_b[_path]))
+    return _diff
+
+
+def format_diff(diff):
+    return '\n'.join('{}: {} != {}'.format(_path, _value_a, _value_b)
+                     for _path, _value_a, _value_b in diff)
@@ -0,0 +1,100 @@
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, local
+
+
+def parallel_map(func, items, max_workers=1):
+    """Calls func for each of the items using a thread pool.
+    Args:
+        func: function which takes one item as an argument
+        items: iterable of items
+        max_workers: maximum number of concurrent calls, 1 or less means serial
+    Returns:
+        list of func results in the same order as items,
+        the first exception raised by func is re-raised
+    """
+    items = list(items)
+    if not max_workers or max_workers <= 1 or len(items) <= 1:
+        return [func(_item) for _item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+class BoundedExecutor(object):
+    """Thread pool shared by all the map calls of one client.
+
+    Only the outermost map runs in parallel, maps called from the pool threads,
+    like per item requests of a namespace fetched in parallel, are serial.
+    So there are never more than max_workers concurrent calls and the pool threads
+    never wait for each other.
+    """
+
+    def __init__(self, max_workers=1):
+        """
+        Args:
+            max_workers: maximum number of concurrent calls, 1 or less means serial
+        """
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = Lock()
+        self._local = local()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+
+    def map(self, func, items):
+        """Calls func for each of the items.
+        Returns:
+            list of func results in the same order as items,
+            the first exception raised by func is re-raised
+        """
+        items = list(items)
+        if not self.max_workers or self.max_workers <= 1 or len(items) <= 1 \
+                or getattr(self._local, 'in_pool', False):
+            return [func(_item) for _item in items]
+
+        def _call(_item):
+            # the thread belongs to the pool from now on
+            self._local.in_pool = True
+            return func(_item)
+        return list(self._get_executor().map(_call, items))
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+
+def collect(functions, foreground=None):
+    """Calls functions without arguments concurrently, each of them in its own thread.
+    Args:
+        functions: dict, name to function
+        foreground: name of the function called in the calling thread,
+            for the clients which are not thread safe, like selenium
+    Returns:
+        tuple of dicts keyed by function names, results and durations in seconds,
+        the first exception raised by a function is re-raised when all of them finished
+    """
+    _durations = {}
+
+    def _timed(name):
+        _start = time.time()
+        try:
+            return functions[name]()
+        finally:
+            _durations[name] = time.time() - _start
+
+    _background = [_name for _name in functions.keys() if _name != foreground]
+    _results = {}
+    with ThreadPoolExecutor(max_workers=max(len(_background), 1)) as executor:
+        _futures = dict((_name, executor.submit(_timed, _name)) for _name in _background)
+        if foreground is not None:
+            _results[foreground] = _timed(foreground)
+        for _name in _background:
+            _results[_name] = _futures[_name].result()
+    return _results, _durations
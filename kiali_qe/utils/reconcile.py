@@ -0,0 +1,122 @@
+""" Keyed comparison of the same entities collected from several sources, UI, REST and OC """
+from collections import OrderedDict
+
+# attributes which are part of the entity basic check, in addition to namespace and name
+_KEY_TYPE_ATTRIBUTES = ('workload_type', 'overview_type')
+
+
+def entity_key(item):
+    """ Returns (namespace, name, type) of the entity,
+    type is None for entities which are not distinguished by type in the basic check.
+    Entities declaring KEY_FIELDS return their precomputed key instead. """
+    if getattr(item, 'KEY_FIELDS', None):
+        return item.key
+    _type = None
+    for _attribute in _KEY_TYPE_ATTRIBUTES:
+        if hasattr(item, _attribute):
+            _type = getattr(item, _attribute)
+            break
+    return (getattr(item, 'namespace', None), getattr(item, 'name', None), _type)
+
+
+def _fields(item):
+    """ Returns public fields of the item, cached key and hash are not part of them """
+    if hasattr(item, '__dict__'):
+        return dict((_name, _value) for _name, _value in vars(item).items()
+                    if not _name.startswith('_'))
+    return dict((_slot, getattr(item, _slot, None))
+                for _cls in type(item).__mro__ for _slot in getattr(_cls, '__slots__', ())
+                if not _slot.startswith('_'))
+
+
+def field_diff(item_a, item_b):
+    """ Returns {field: (value of item_a, value of item_b)} of the fields which differ """
+    _fields_a = _fields(item_a)
+    _fields_b = _fields(item_b)
+    _diff = OrderedDict()
+    for _field in sorted(set(_fields_a.keys()) | set(_fields_b.keys())):
+        if _fields_a.get(_field) != _fields_b.get(_field):
+            _diff[_field] = (_fields_a.get(_field), _fields_b.get(_field))
+    return _diff
+
+
+class Reconciliation(object):
+    """ Result of reconcile.
+
+    Attributes, all of them are dicts keyed by source name:
+        missing: reference items not found in the source
+        extra: source items not matching any of the reference items
+        mismatched: (reference item, source item, field_diff) of items found by the basic check
+            which failed the advanced check
+    """
+
+    def __init__(self, source_names):
+        self.missing = OrderedDict((_name, []) for _name in source_names)
+        self.extra = OrderedDict((_name, []) for _name in source_names)
+        self.mismatched = OrderedDict((_name, []) for _name in source_names)
+
+    def is_matching(self, source_name, allow_extra=False):
+        """ True when every reference item was found in the source and passed the check """
+        return len(self.missing[source_name]) == 0 \
+            and len(self.mismatched[source_name]) == 0 \
+            and (allow_extra or len(self.extra[source_name]) == 0)
+
+    def report(self, source_name):
+        _lines = []
+        for _item in self.missing[source_name]:
+            _lines.append('{} not found in {}'.format(_item, source_name))
+        for _item_a, _item_b, _diff in self.mismatched[source_name]:
+            _lines.append('{} differs in {}: {}'.format(
+                _item_a, source_name,
+                ', '.join('{}: {} != {}'.format(_field, _values[0], _values[1])
+                          for _field, _values in _diff.items())))
+        for _item in self.extra[source_name]:
+            _lines.append('{} only in {}'.format(_item, source_name))
+        return '\n'.join(_lines)
+
+    def __str__(self):
+        return '\n'.join(_report for _report in
+                         [self.report(_name) for _name in self.missing.keys()] if _report)
+
+
+def reconcile(reference, sources, advanced_check=(), key=entity_key):
+    """ Compares reference items with the items of every source.
+
+    Each source is indexed by key once and reference items are joined by key,
+    instead of comparing every pair. Items of the same key are paired by entity is_equal,
+    items passing the advanced check are preferred.
+
+    Args:
+        reference: list of entities, UI items usually
+        sources: dict, source name to list of entities
+        advanced_check: names of sources compared with advanced check, others with basic check
+        key: function returning hashable key of an entity, it has to be equal for entities
+            passing the basic check
+    Returns:
+        Reconciliation
+    """
+    _result = Reconciliation(sources.keys())
+    for _name, _items in sources.items():
+        _advanced = _name in advanced_check
+        _index = OrderedDict()
+        for _item in _items:
+            _index.setdefault(key(_item), []).append(_item)
+        for _item in reference:
+            _candidates = _index.get(key(_item), [])
+            _match = None
+            if _advanced:
+                _match = next((_c for _c in _candidates
+                               if _item.is_equal(_c, advanced_check=True)), None)
+            if _match is None:
+                _match = next((_c for _c in _candidates
+                               if _item.is_equal(_c, advanced_check=False)), None)
+                if _match is None:
+                    _result.missing[_name].append(_item)
+                    continue
+                if _advanced:
+                    _result.mismatched[_name].append((_item, _match, field_diff(_item, _match)))
+            # by identity, equal items can be different objects
+            _candidates.pop(next(_i for _i, _c in enumerate(_candidates) if _c is _match))
+        for _candidates in _index.values():
+            _result.extra[_name].extend(_candidates)
+    return _result
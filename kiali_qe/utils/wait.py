@@ -0,0 +1,150 @@
+""" Wait engine with exponential backoff polling and wait duration statistics """
+import re
+import time
+
+from threading import Lock
+
+from wait_for import TimedOutError
+
+from kiali_qe.utils.log import logger
+
+# first polling delay, it is doubled after every unsuccessful check up to MAX_DELAY
+INITIAL_DELAY = 0.05
+MAX_DELAY = 1.0
+
+# script timeout of the web drivers (W3C default), it is changed only during browser waits
+SCRIPT_TIMEOUT = 30
+
+_TIMEOUT_REGEX = re.compile('^(\\d+(\\.\\d+)?)\\s*(ms|s|m)?$')
+
+_stats = {}
+_stats_lock = Lock()
+
+# resolves with true as soon as the condition returns true on any DOM mutation,
+# with false when the timeout passes
+# arguments: condition function body, timeout in ms, callback
+_BROWSER_WAIT_SCRIPT = """
+    var condition = new Function(arguments[0]), timeout = arguments[1];
+    var callback = arguments[arguments.length - 1];
+    if (condition()) {
+        callback(true);
+        return;
+    }
+    var observer = new MutationObserver(function () {
+        if (condition()) {
+            observer.disconnect();
+            clearTimeout(timer);
+            callback(true);
+        }
+    });
+    var timer = setTimeout(function () {
+        observer.disconnect();
+        callback(condition());
+    }, timeout);
+    observer.observe(document.body, {childList: true, subtree: true, attributes: true});
+"""
+
+
+def parse_timeout(timeout):
+    """ Returns timeout in seconds.
+    Args:
+        timeout: number of seconds or string like '500ms', '5s', '1m'
+    """
+    if isinstance(timeout, (int, float)):
+        return float(timeout)
+    _match = _TIMEOUT_REGEX.match(str(timeout).strip())
+    if not _match:
+        raise ValueError('Invalid timeout: {}'.format(timeout))
+    _value = float(_match.group(1))
+    _unit = _match.group(3)
+    if _unit == 'ms':
+        return _value / 1000
+    elif _unit == 'm':
+        return _value * 60
+    return _value
+
+
+def record(name, duration, timed_out=False):
+    """ Records duration of a wait """
+    with _stats_lock:
+        _entry = _stats.setdefault(name, {'count': 0, 'total': 0.0, 'max': 0.0, 'timeouts': 0})
+        _entry['count'] += 1
+        _entry['total'] += duration
+        _entry['max'] = max(_entry['max'], duration)
+        if timed_out:
+            _entry['timeouts'] += 1
+
+
+def stats():
+    """ Returns list of (name, stats dict) sorted by total wait duration, longest first """
+    with _stats_lock:
+        return sorted([(_name, dict(_entry)) for _name, _entry in _stats.items()],
+                      key=lambda _item: _item[1]['total'], reverse=True)
+
+
+def log_stats():
+    for _name, _entry in stats():
+        logger.info('Wait {}: count {}, total {:.2f}s, max {:.2f}s, timeouts {}'.format(
+            _name, _entry['count'], _entry['total'], _entry['max'], _entry['timeouts']))
+
+
+def wait(condition, timeout=10, name=None, silent_failure=True, very_quiet=True):
+    """ Waits until condition returns True.
+    The condition is checked immediately, so there is no delay when it already holds,
+    then it is polled with exponential backoff.
+    Args:
+        condition: function without arguments
+        timeout: seconds or string like '10s'
+        name: name under which the duration is recorded, condition name when not set
+        silent_failure: return False on timeout instead of raising TimedOutError
+        very_quiet: do not log timeouts
+    Returns:
+        True when the condition was met, False on timeout
+    """
+    _name = name if name else getattr(condition, '__name__', 'wait')
+    _start = time.time()
+    _end = _start + parse_timeout(timeout)
+    _delay = INITIAL_DELAY
+    _result = condition()
+    while not _result and time.time() < _end:
+        time.sleep(min(_delay, max(_end - time.time(), 0)))
+        _delay = min(_delay * 2, MAX_DELAY)
+        _result = condition()
+    return _finish(_name, _start, bool(_result), timeout, silent_failure, very_quiet)
+
+
+def wait_in_browser(selenium, condition_script, timeout=10, name=None,
+                    silent_failure=True, very_quiet=True):
+    """ Waits in the browser until condition_script returns true, the condition is
+    checked on every DOM mutation instead of polling from here.
+    Args:
+        selenium: selenium web driver
+        condition_script: body of javascript function which returns boolean
+        timeout: seconds or string like '10s'
+        name: name under which the duration is recorded
+        silent_failure: return False on timeout instead of raising TimedOutError
+        very_quiet: do not log timeouts
+    Returns:
+        True when the condition was met, False on timeout
+    """
+    _name = name if name else 'browser wait'
+    _timeout = parse_timeout(timeout)
+    _start = time.time()
+    # leave some time for the script to report the timeout itself
+    selenium.set_script_timeout(_timeout + 5)
+    try:
+        _result = selenium.execute_async_script(_BROWSER_WAIT_SCRIPT, condition_script,
+                                                int(_timeout * 1000))
+    finally:
+        selenium.set_script_timeout(SCRIPT_TIMEOUT)
+    return _finish(_name, _start, bool(_result), timeout, silent_failure, very_quiet)
+
+
+def _finish(name, start, result, timeout, silent_failure, very_quiet):
+    record(name, time.time() - start, timed_out=not result)
+    if not result:
+        if not very_quiet:
+            logger.debug('Wait {} timed out after {}'.format(name, timeout))
+        if not silent_failure:
+            raise TimedOutError('Could not do {} in time {}'.format(name, timeout))
+    return result